@@ -1,9 +1,12 @@
+import functools
 import logging
 import typing
 
 import sqlite3
 import sqlalchemy.exc
 import pandas as pd
+import sklearn.base
+import sklearn.preprocessing
 
 import src.read_write_functions
 import src.preprocess_app_input
@@ -13,6 +16,18 @@ from src.create_tables_rds import QueryManager, ActivePrediction
 logger = logging.getLogger(__name__)
 
 
+class OneHotEncoderCache(typing.NamedTuple):
+    """This class holds the data that is computed once from the fit one-hot-encoder when the web app loads it, so that
+    it is not rebuilt on every prediction.
+
+    Attributes:
+        one_hot_column_names (typing.Sequence): The names of the one hot encoded output columns.
+        one_hot_lookup (typing.List): The lookup tables built by src.preprocess_app_input.one_hot_lookup_tables.
+    """
+    one_hot_column_names: typing.Sequence
+    one_hot_lookup: typing.List
+
+
 def run_app_prediction(new_query_params: dict,
                        model_object_path: str,
                        one_hot_encoder_path: str,
@@ -35,7 +50,7 @@ def run_app_prediction(new_query_params: dict,
 
     # Try to read the one-hot-encoder
     try:
-        one_hot_encoder = src.read_write_functions.load_model_object(one_hot_encoder_path)
+        one_hot_encoder, one_hot_encoder_cache = load_one_hot_encoder(one_hot_encoder_path)
     except ValueError as val_error:
         # This error will occur if the one-hot-encoder cannot be read.
         logger.error("Failed to load in the one-hot-encoder object.")
@@ -43,7 +58,7 @@ def run_app_prediction(new_query_params: dict,
 
     # Try to read the model object
     try:
-        model = src.read_write_functions.load_model_object(model_object_path)
+        model = load_trained_model(model_object_path)
     except ValueError as val_error:
         # This error will occur if the model object cannot be read.
         logger.error("Failed to load in the trained model object.")
@@ -66,13 +81,16 @@ def run_app_prediction(new_query_params: dict,
         prediction_df = src.preprocess_app_input.\
             predict_preprocess(predictors=predictors,
                                one_hot_encoder=one_hot_encoder,
+                               one_hot_column_names=one_hot_encoder_cache.one_hot_column_names,
+                               one_hot_lookup=one_hot_encoder_cache.one_hot_lookup,
                                remove_outlier_params=config_dict["remove_outliers"],
                                **config_dict["process_user_input"]["app_input_transformations"],
                                **config_dict["generate_features"]["pipeline_and_app"])
-    # Catch both TypeError and KeyError in one except block. More detailed exception handling occurs in the module,
-    # where there are custom logging messages for each individual exception. Here, because I want to handle these
-    # errors in the same way, it is more succinct to catch them in one except block.
-    except (TypeError, KeyError) as preprocess_error:
+    # Catch TypeError, KeyError, and ValueError in one except block. More detailed exception handling occurs in the
+    # module, where there are custom logging messages for each individual exception. Here, because I want to handle
+    # these errors in the same way, it is more succinct to catch them in one except block. A ValueError occurs if the
+    # user input is outside of the valid range of values.
+    except (TypeError, KeyError, ValueError) as preprocess_error:
         logger.error("Failed to complete data preprocessing steps of user input. %s", preprocess_error)
         raise preprocess_error
     logger.info("Successfully preprocessed user input.")
@@ -99,6 +117,50 @@ def run_app_prediction(new_query_params: dict,
     return prediction, traffic_volume
 
 
+@functools.lru_cache(maxsize=None)
+def load_trained_model(model_object_path: str) -> sklearn.base.BaseEstimator:
+    """This function loads the trained model object used by the web app. The loaded object is cached so that the
+    joblib file is only read from disk once per process rather than once per prediction. The web app must be restarted
+    to pick up a newly trained model.
+
+    Args:
+        model_object_path (str): The path to the trained model object.
+
+    Returns:
+        model (sklearn.base.BaseEstimator): The trained model object.
+
+    Raises:
+        ValueError: This function raises a ValueError if the model object cannot be read. Failed loads are not cached.
+    """
+    model = src.read_write_functions.load_model_object(model_object_path)
+    return model
+
+
+@functools.lru_cache(maxsize=None)
+def load_one_hot_encoder(one_hot_encoder_path: str
+                         ) -> typing.Tuple[sklearn.preprocessing.OneHotEncoder, OneHotEncoderCache]:
+    """This function loads the fit one-hot-encoder used by the web app. The loaded object is cached, and the names of
+    the one-hot-encoded output columns and the one hot lookup tables are computed once here and returned alongside
+    the encoder so that they are not rebuilt on every prediction.
+
+    Args:
+        one_hot_encoder_path (str): The path to the fit one-hot-encoder.
+
+    Returns:
+        one_hot_encoder, one_hot_encoder_cache (typing.Tuple[sklearn.preprocessing.OneHotEncoder, OneHotEncoderCache]):
+            The fit one-hot-encoder and the data computed from it.
+
+    Raises:
+        ValueError: This function raises a ValueError if the one-hot-encoder cannot be read. Failed loads are not
+            cached.
+    """
+    one_hot_encoder = src.read_write_functions.load_model_object(one_hot_encoder_path)
+    one_hot_encoder_cache = \
+        OneHotEncoderCache(one_hot_column_names=one_hot_encoder.get_feature_names_out(),
+                           one_hot_lookup=src.preprocess_app_input.one_hot_lookup_tables(one_hot_encoder))
+    return one_hot_encoder, one_hot_encoder_cache
+
+
 def run_update_historical_queries(query_manager: QueryManager,
                                   new_query_params: dict,
                                   prediction: float) -> None:
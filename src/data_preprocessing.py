@@ -136,7 +136,7 @@ def columns_drop(data: pd.DataFrame, columns: typing.List) -> pd.DataFrame:
         logger.error("At least one column that was attempted to drop does not exist. %s", key_error)
     else:
         logger.info("Dropped the following columns from the dataset: %s",
-                    str(columns))
+                    columns)
     return data
 
 
@@ -163,7 +163,8 @@ def log_transform(data: pd.DataFrame,
     """
     for column_log in log_transform_column_names:
         try:
-            data[log_transform_new_column_prefix + column_log] = np.log1p(data[column_log])
+            # Apply the transformation to the underlying array so pandas does not dispatch it through the Series.
+            data[log_transform_new_column_prefix + column_log] = log_transform_value(data[column_log].to_numpy())
         except TypeError as type_error:
             # For example, a string cannot be log-transformed.
             logger.error("Could not log transform the column. Data type cannot be log transformed.")
@@ -179,6 +180,25 @@ def log_transform(data: pd.DataFrame,
     return data
 
 
+def log_transform_value(value: typing.Union[float, np.ndarray]) -> typing.Union[float, np.ndarray]:
+    """This function is a helper function that log transforms a value with np.log1p in order to avoid taking the log
+    of zero. It accepts a single value or an array of values, so the same rule is used for a single query from the web
+    app and for a whole column.
+
+    Args:
+        value (typing.Union[float, np.ndarray]): The value to log transform, or an array of values.
+
+    Returns:
+        log_value (typing.Union[float, np.ndarray]): The log transformed value, or an array of log transformed values.
+
+    Raises:
+        TypeError: This function raises a TypeError if the value is not numeric.
+
+    """
+    log_value = np.log1p(value)
+    return log_value
+
+
 def binarize_column(data: pd.DataFrame,
                     binarize_column_names: typing.List,
                     binarize_new_column_prefix: str,
@@ -202,8 +222,9 @@ def binarize_column(data: pd.DataFrame,
     # Loop through the list of columns to binarize.
     for column_binarize in binarize_column_names:
         try:
-            data[binarize_new_column_prefix + column_binarize] = data[column_binarize] \
-                .apply(func=binarize, args=[binarize_zero_value])
+            # Pass the whole column to binarize at once rather than calling it on each value.
+            data[binarize_new_column_prefix + column_binarize] = \
+                binarize(data[column_binarize].to_numpy(), binarize_zero_value)
         except KeyError as key_error:
             logger.error("Could not binarize the column. The specified column does not exist in the dataframe.")
             raise key_error
@@ -214,26 +235,30 @@ def binarize_column(data: pd.DataFrame,
     return data
 
 
-def binarize(value: str, zero_value: str) -> int:
+def binarize(value: typing.Union[str, np.ndarray], zero_value: str) -> typing.Union[int, np.ndarray]:
     """This function is a helper function that converts an input string value to a zero-one binary variable
-    depending on the "zero_value"
+    depending on the "zero_value". An array of values is converted element by element, so the same rule is used for a
+    single query from the web app and for a whole column.
 
     Args:
-        value (str): Value to convert to 0-1 variable
+        value (typing.Union[str, np.ndarray]): Value to convert to 0-1 variable, or an array of values.
         zero_value (str): Value to convert to zero. All values not matching the zero will be converted to one.
 
     Returns:
-        return_value (int): Returns either a 0 or 1 depending on the input data.
+        return_value (typing.Union[int, np.ndarray]): Returns either a 0 or 1 depending on the input data, or an
+            int64 array of 0s and 1s if the input is an array.
 
     Raises: This function does not raise any errors.
 
     """
     # If the zero_value is an invalid datatype (not a string), return 1.
-    return_value = 1
     if not isinstance(zero_value, str):
-        return return_value
-    if value == zero_value:
-        return_value = 0
+        if isinstance(value, np.ndarray):
+            return np.ones(value.shape, dtype="int64")
+        return 1
+    if isinstance(value, np.ndarray):
+        return (value != zero_value).astype("int64")
+    return_value = int(value != zero_value)
 
     return return_value
 
@@ -375,14 +400,17 @@ def one_hot_encoding(data: pd.DataFrame,
         raise key_error
     else:
 
-        # Join the one_hot_encoded columns back to the original dataframe and drop the original columns.
+        # Drop the original columns and place the one_hot_encoded columns next to the remaining columns. The one hot
+        # encoded rows are in the same order as the data, so sharing its index avoids the index alignment of a join.
         one_hot_column_names = one_hot_encoder.get_feature_names_out()
-        one_hot_df = pd.DataFrame(one_hot_array, columns=one_hot_column_names)
-        data_one_hot_encoded = data.join(one_hot_df).drop(one_hot_encode_columns, axis=1)
+        one_hot_df = pd.DataFrame(one_hot_array, columns=one_hot_column_names, index=data.index)
+        data_one_hot_encoded = pd.concat([data.drop(columns=one_hot_encode_columns), one_hot_df], axis=1, copy=False)
 
-        logger.info("One Hot Encoded the following columns: %s", str(one_hot_encode_columns))
+        logger.info("One Hot Encoded the following columns: %s", one_hot_encode_columns)
         logger.info("After One Hot Encoding, data has %d columns.", data_one_hot_encoded.shape[1])
-        logger.info("Number of NA values: %d", data_one_hot_encoded.isna().sum().sum())
+        # Counting the NA values scans the whole dataframe, so only do it when the message will be logged.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Number of NA values: %d", data_one_hot_encoded.isna().sum().sum())
 
     return data_one_hot_encoded, one_hot_encoder
 
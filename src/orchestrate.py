@@ -53,7 +53,8 @@ def run_clean_data(command_line_args: argparse.Namespace, config_dict: dict) ->
         This function does not raise any errors.
     """
     try:
-        raw_data = src.read_write_s3.s3_read(s3_source=command_line_args.input_source)
+        raw_data = src.read_write_s3.s3_read(s3_source=command_line_args.input_source,
+                                             **config_dict["read_raw_data"])
     except ValueError:
         # This error will be raised if reading the data from S3 fails for any reason.
         # See the logs for the src.read_write_s3 module for more specific information on why reading failed.
@@ -159,7 +160,10 @@ def run_train_model(command_line_args: argparse.Namespace, config_dict: dict) ->
             except ValueError:
                 logger.error("The model failed to be fit.")
             else:
-                src.read_write_functions.save_model_object(trained_model, command_line_args.model_output_source)
+                # The web app only pays the extra time to decompress the model once per process because it caches
+                # the loaded model.
+                src.read_write_functions.save_model_object(trained_model, command_line_args.model_output_source,
+                                                           **config_dict["model_training"]["save_model_object"])
 
 
 def run_predict(command_line_args: argparse.Namespace, config_dict: dict) -> None:
@@ -1,6 +1,8 @@
+import functools
 import logging
 import typing
 
+import numpy as np
 import pandas as pd
 import sklearn.preprocessing
 
@@ -16,7 +18,12 @@ def predict_preprocess(predictors: dict,
                        remove_outlier_params: dict,
                        temperature_column: str,
                        one_hot_encoding_params: dict,
-                       one_hot_encoder: sklearn.preprocessing.OneHotEncoder) -> pd.DataFrame:
+                       one_hot_encoder: sklearn.preprocessing.OneHotEncoder,
+                       output_dtype: typing.Optional[str] = None,
+                       one_hot_column_names: typing.Optional[typing.Sequence] = None,
+                       one_hot_lookup: typing.Optional[
+                           typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]] = None
+                       ) -> pd.DataFrame:
     """This is an orchestration function that calls the necessary functions to perform feature transformations on the
     user's input from the web application. It calls functions to binarize columns, log-transform columns,
     remove outliers, and to one-hot-encode the user input with a fit one-hot-encoder.
@@ -30,6 +37,16 @@ def predict_preprocess(predictors: dict,
             fahrenheit to kelvin.
         one_hot_encoding_params (dict): The parameters needed to one-hot-encode the user input.
         one_hot_encoder (sklearn.preprocessing.OneHotEncoder): A pre-trained one-hot-encoder sklearn model.
+        output_dtype (typing.Optional[str]): The data type to cast the preprocessed data to, such as 'float32'. If
+            None, the data types are left unchanged. Defaults to None.
+        one_hot_column_names (typing.Optional[typing.Sequence]): The names of the one hot encoded output columns, as
+            returned by the encoder's get_feature_names_out method. Passing names computed once when the encoder is
+            loaded saves computing them for every query. If None, they are computed from the encoder. Defaults to
+            None.
+        one_hot_lookup (typing.Optional[typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]]): The
+            lookup tables built by one_hot_lookup_tables for the encoder. Passing tables built once when the encoder
+            is loaded saves building them for every query. If None, they are built from the encoder. Defaults to
+            None.
 
     Returns:
         data_one_hot_encoded (pd.DataFrame): A pandas dataframe with the user input after feature transformation and
@@ -39,37 +56,109 @@ def predict_preprocess(predictors: dict,
         KeyError: This function raises a key error if one of the required columns for the feature transformations
             does not exist in the dataframe.
         TypeError: This function raises a type error if one of the columns contains an unexpected datatype.
+        ValueError: This function raises a value error if the user input is outside of the valid range of values.
 
     """
+    # A single query is transformed as a dictionary of values, and a dataframe is only created once at the end. The
+    # output matches predict_preprocess_batch for a batch of one query.
+    record = app_input_record_transformations(record=dict(predictors),
+                                              binarize_column_params=binarize_column_params,
+                                              log_transform_params=log_transform_params,
+                                              remove_outlier_params=remove_outlier_params,
+                                              temperature_column=temperature_column)
+    data_one_hot_encoded = \
+        app_input_record_one_hot_encode(record=record,
+                                        one_hot_encoder=one_hot_encoder,
+                                        one_hot_encode_columns=one_hot_encoding_params["one_hot_encode_columns"],
+                                        output_dtype=output_dtype,
+                                        one_hot_column_names=one_hot_column_names,
+                                        one_hot_lookup=one_hot_lookup)
+    return data_one_hot_encoded
 
-    # First, make each value of the dictionary into a list of 1 value so it can be used to create a dataframe of 1 row
-    predictors_dict_as_single_item_lists = {}
-    for column_name, value in predictors.items():
-        predictors_dict_as_single_item_lists[column_name] = [value]
-    prediction_df = pd.DataFrame(predictors_dict_as_single_item_lists)
 
-    # Call the app_input_transformations function
-    try:
-        prediction_df = app_input_transformations(prediction_df=prediction_df,
-                                                  log_transform_params=log_transform_params,
-                                                  binarize_column_params=binarize_column_params,
-                                                  remove_outlier_params=remove_outlier_params,
-                                                  temperature_column=temperature_column)
-    # Catch both TypeError and KeyError in one block. Handle the errors in the same way.
-    except (TypeError, KeyError) as input_transformations_error:
-        logger.error("Failed to complete input transformations for the user input.")
-        raise input_transformations_error
-
-    # Call the function to one_hot_encode the user input with the trained one-hot-encoder.
-    try:
-        data_one_hot_encoded = \
-            app_input_one_hot_encode(prediction_df=prediction_df,
-                                     one_hot_encoder=one_hot_encoder,
-                                     one_hot_encode_columns=one_hot_encoding_params["one_hot_encode_columns"])
-    except KeyError as key_error:
-        # This exception will occur if the columns expected by the one-hot-encoder do not exist in the user input
-        logger.info("Failed to one-hot-encoded the user input.")
-        raise key_error
+def predict_preprocess_batch(predictors_list: typing.List[dict],
+                             binarize_column_params: dict,
+                             log_transform_params: dict,
+                             remove_outlier_params: dict,
+                             temperature_column: str,
+                             one_hot_encoding_params: dict,
+                             one_hot_encoder: sklearn.preprocessing.OneHotEncoder,
+                             output_dtype: typing.Optional[str] = None,
+                             one_hot_column_names: typing.Optional[typing.Sequence] = None,
+                             one_hot_lookup: typing.Optional[
+                                 typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]] = None
+                             ) -> pd.DataFrame:
+    """This function performs the same feature transformations as predict_preprocess, but for many queries at once.
+    All of the queries are placed into one dataframe so that each transformation runs once for the whole batch rather
+    than once per query. Unlike predict_preprocess, a query outside of the valid range of values does not raise an
+    error. It is removed as an outlier and the remaining queries are returned, so the output can have fewer rows than
+    the input, or none at all.
+
+    Args:
+        predictors_list (typing.List[dict]): A list of validated user inputs, each as a dictionary.
+        binarize_column_params (dict): The parameters needed to binarize the columns.
+        log_transform_params (dict): The parameters needed to log-transform the columns.
+        remove_outlier_params (dict): The parameters needed to remove outliers.
+        temperature_column (str): The name of the column containing the temperature. Used for converting from
+            fahrenheit to kelvin.
+        one_hot_encoding_params (dict): The parameters needed to one-hot-encode the user input.
+        one_hot_encoder (sklearn.preprocessing.OneHotEncoder): A pre-trained one-hot-encoder sklearn model.
+        output_dtype (typing.Optional[str]): The data type to cast the preprocessed data to, such as 'float32'. If
+            None, the data types are left unchanged. Defaults to None.
+        one_hot_column_names (typing.Optional[typing.Sequence]): The names of the one hot encoded output columns, as
+            returned by the encoder's get_feature_names_out method. Passing names computed once when the encoder is
+            loaded saves computing them for every query. If None, they are computed from the encoder. Defaults to
+            None.
+        one_hot_lookup (typing.Optional[typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]]): The
+            lookup tables built by one_hot_lookup_tables for the encoder. Passing tables built once when the encoder
+            is loaded saves building them for every query. If None, they are built from the encoder. Defaults to
+            None.
+
+    Returns:
+        data_one_hot_encoded (pd.DataFrame): A pandas dataframe with one row per valid query after feature
+            transformation and one-hot-encoding, in the order the queries were given. Queries that fail the outlier
+            checks are removed, and the index is reset to run from 0.
+
+    Raises:
+        KeyError: This function raises a key error if one of the required columns for the feature transformations
+            does not exist in the dataframe.
+        TypeError: This function raises a type error if one of the columns contains an unexpected datatype.
+        ValueError: This function raises a value error if predictors_list is empty.
+
+    """
+    # An empty list has no columns to transform, so report it directly rather than as a missing column.
+    if not predictors_list:
+        logger.error("Failed to preprocess the user input. No queries were given.")
+        raise ValueError("No queries were given to preprocess.")
+
+    # First, create a dataframe with one row per query. The values have already been cast to their expected data
+    # types during input validation, so the records can be used directly.
+    prediction_df = pd.DataFrame.from_records(predictors_list)
+
+    # Call the app_input_transformations function and then one-hot-encode the user input with the trained
+    # one-hot-encoder. Both functions log the reason for any failure where it occurs, so their exceptions are left to
+    # propagate to the caller.
+    prediction_df = app_input_transformations(prediction_df=prediction_df,
+                                              log_transform_params=log_transform_params,
+                                              binarize_column_params=binarize_column_params,
+                                              remove_outlier_params=remove_outlier_params,
+                                              temperature_column=temperature_column)
+    data_one_hot_encoded = \
+        app_input_one_hot_encode(prediction_df=prediction_df,
+                                 one_hot_encoder=one_hot_encoder,
+                                 one_hot_encode_columns=one_hot_encoding_params["one_hot_encode_columns"],
+                                 one_hot_column_names=one_hot_column_names,
+                                 one_hot_lookup=one_hot_lookup)
+
+    # The random forest converts its input to float32 before predicting, so casting here once as a single block
+    # lets the model use the data without another conversion.
+    if output_dtype is not None:
+        try:
+            data_one_hot_encoded = data_one_hot_encoded.astype(output_dtype, copy=False)
+        except (TypeError, ValueError) as astype_error:
+            # This error will occur if the data type is invalid or a column cannot be cast to it.
+            logger.error("Failed to cast the preprocessed user input to %s.", output_dtype)
+            raise astype_error
 
     return data_one_hot_encoded
 
@@ -92,7 +181,8 @@ def app_input_transformations(prediction_df: pd.DataFrame,
 
     Returns:
         prediction_df (pd.DataFrame): The function returns the data after the 2 transformations plus outlier removal
-        have been performed.
+        have been performed. Rows outside of the valid range of values are removed rather than raising an error, and
+        the index is reset if any rows were removed.
 
     Raises:
         KeyError: This function raises a key error if one of the required columns for the feature transformations
@@ -100,38 +190,28 @@ def app_input_transformations(prediction_df: pd.DataFrame,
         TypeError: This function raises a type error if one of the columns contains an unexpected datatype.
 
     """
-    # Binarize columns
-    try:
-        prediction_df = src.data_preprocessing.binarize_column(prediction_df, **binarize_column_params)
-    except KeyError as binarize_error:
-        # This error will occur if columns to binarize do not exist in the user input
-        logger.error("Failed to binarize columns.")
-        raise binarize_error
-    logger.debug("Binarized user input columns.")
-
-    # Log transform columns
-    try:
-        prediction_df = src.data_preprocessing.log_transform(prediction_df, **log_transform_params)
-    except (TypeError, KeyError) as log_transform_error:
-        # Handle all errors from log-transformation in the same manner.
-        logger.error("Failed to log transform the specified columns.")
-        raise log_transform_error
-    logger.debug("Log-transformed user input columns.")
-
-    # Convert fahrenheit to kelvin
-    try:
-        prediction_df[temperature_column] = src.data_preprocessing.fahrenheit_to_kelvin(
-            prediction_df[temperature_column])
-    except TypeError as temp_conversion_error:
-        # This error will occur if input temperature is not a float or an integer
-        logger.error("Failed to convert from fahrenheit to kelvin.")
-        raise temp_conversion_error
-    logger.debug("Converted from fahrenheit to kelvin.")
+    # Check once that the columns needed by the transformations exist and are numeric where they need to be, so that
+    # the transformations below can run without handling errors one at a time.
+    _validate_transformation_columns(prediction_df,
+                                     binarize_column_names=binarize_column_params["binarize_column_names"],
+                                     numeric_column_names=[*log_transform_params["log_transform_column_names"],
+                                                           temperature_column])
+
+    # Binarize columns, log transform columns, and convert fahrenheit to kelvin with the same helpers used for a
+    # single query. Each source column is read once as an array and all of the new values are computed before the
+    # dataframe is changed. The original columns are then dropped and the new columns added in one step.
+    source_columns = {column_name: prediction_df[column_name].to_numpy()
+                      for column_name in (*binarize_column_params["binarize_column_names"],
+                                          *log_transform_params["log_transform_column_names"], temperature_column)}
+    new_columns = _transformed_values(source_columns,
+                                      binarize_column_params=binarize_column_params,
+                                      log_transform_params=log_transform_params,
+                                      temperature_column=temperature_column)
 
-    # Drop columns not needed after transformations
     cols_drop = list(log_transform_params["log_transform_column_names"]) + \
         list(binarize_column_params["binarize_column_names"])
-    prediction_df = src.data_preprocessing.columns_drop(prediction_df, columns=cols_drop)
+    prediction_df = prediction_df.drop(columns=cols_drop).assign(**new_columns)
+    logger.debug("Binarized, log-transformed, and converted the temperature of the user input.")
 
     # Perform data validation on the user input by calling invalid input an "outlier" and removing it.
     try:
@@ -145,19 +225,99 @@ def app_input_transformations(prediction_df: pd.DataFrame,
         logger.error("Failed to remove outliers.")
         raise remove_outlier_error
     logger.debug("Successfully removed outliers (if any).")
-    prediction_df = prediction_df.reset_index(drop=True)
+    # Only rebuild the index if removing outliers left gaps in it.
+    if not prediction_df.index.equals(pd.RangeIndex(len(prediction_df.index))):
+        prediction_df = prediction_df.reset_index(drop=True)
     return prediction_df
 
 
+def _validate_transformation_columns(prediction_df: pd.DataFrame,
+                                     binarize_column_names: typing.List,
+                                     numeric_column_names: typing.List) -> None:
+    """This helper function checks that the columns used by app_input_transformations exist in the dataframe and
+    that the columns that are log-transformed or converted to kelvin are numeric.
+
+    Args:
+        prediction_df (pd.DataFrame): The input dataframe with the user input.
+        binarize_column_names (typing.List): The columns that are binarized.
+        numeric_column_names (typing.List): The columns that must be numeric.
+
+    Returns:
+        This function does not return any objects.
+
+    Raises:
+        KeyError: This function raises a key error if one of the columns does not exist in the dataframe.
+        TypeError: This function raises a type error if one of the numeric columns is not numeric.
+
+    """
+    missing_columns = [column_name for column_name in (*binarize_column_names, *numeric_column_names)
+                       if column_name not in prediction_df.columns]
+    if missing_columns:
+        logger.error("Failed to transform the user input. The columns %s do not exist in the data.", missing_columns)
+        raise KeyError(missing_columns)
+
+    non_numeric_columns = [column_name for column_name in numeric_column_names
+                           if not pd.api.types.is_numeric_dtype(prediction_df[column_name])]
+    if non_numeric_columns:
+        logger.error("Failed to transform the user input. The columns %s are not numeric.", non_numeric_columns)
+        raise TypeError(f"The columns {non_numeric_columns} are not numeric.")
+
+
+def _transformed_values(values: typing.Mapping,
+                        binarize_column_params: dict,
+                        log_transform_params: dict,
+                        temperature_column: str) -> dict:
+    """This helper function binarizes columns, log-transforms columns, and converts fahrenheit to kelvin for both
+    app_input_transformations and app_input_record_transformations. The values of each column can be a single value
+    or an array, so a single query and a dataframe are transformed by the same rules.
+
+    Args:
+        values (typing.Mapping): The value, or array of values, of each column to transform.
+        binarize_column_params (dict): The parameters needed to binarize the columns.
+        log_transform_params (dict): The parameters needed to log-transform the columns.
+        temperature_column (str): The name of the column containing the temperature.
+
+    Returns:
+        new_values (dict): The converted temperature followed by the binarized and log-transformed columns, in the
+            order they are added to the user input.
+
+    Raises:
+        KeyError: This function raises a key error if one of the columns to transform is missing.
+        TypeError: This function raises a type error if a value to log-transform or convert is not numeric.
+
+    """
+    new_values = {temperature_column: src.data_preprocessing.fahrenheit_to_kelvin(values[temperature_column])}
+    for column_binarize in binarize_column_params["binarize_column_names"]:
+        new_values[binarize_column_params["binarize_new_column_prefix"] + column_binarize] = \
+            src.data_preprocessing.binarize(values[column_binarize], binarize_column_params["binarize_zero_value"])
+    for column_log in log_transform_params["log_transform_column_names"]:
+        new_values[log_transform_params["log_transform_new_column_prefix"] + column_log] = \
+            src.data_preprocessing.log_transform_value(values[column_log])
+    return new_values
+
+
 def app_input_one_hot_encode(prediction_df: pd.DataFrame,
                              one_hot_encoder: sklearn.preprocessing.OneHotEncoder,
-                             one_hot_encode_columns: typing.List) -> pd.DataFrame:
-    """This function one-hot-encodes the input data using a pre-trained one-hot-encoder object
+                             one_hot_encode_columns: typing.List,
+                             one_hot_column_names: typing.Optional[typing.Sequence] = None,
+                             one_hot_lookup: typing.Optional[
+                                 typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]] = None
+                             ) -> pd.DataFrame:
+    """This function one-hot-encodes the input data using a pre-trained one-hot-encoder object. Rather than calling the
+    encoder's transform method, each column is converted to a categorical with the encoder's categories, and the
+    category codes are used to look up rows of a precomputed one-hot table. For a single query from the web app, the
+    codes are looked up in a precomputed dictionary instead of building a categorical. The output is the same as the
+    encoder's.
 
     Args:
         prediction_df (pd.DataFrame): The input dataframe to be one-hot-encoded.
         one_hot_encoder (sklearn.preprocessing.OneHotEncoder): The one-hot-encoder object to use to transform the data.
         one_hot_encode_columns (typing.List): The list of columns to one-hot-encode.
+        one_hot_column_names (typing.Optional[typing.Sequence]): The names of the one hot encoded output columns. If
+            None, they are computed from the encoder. Defaults to None.
+        one_hot_lookup (typing.Optional[typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]]): The
+            lookup tables built by one_hot_lookup_tables for the encoder. If None, they are built from the encoder.
+            Defaults to None.
 
     Returns:
         data_one_hot_encoded (pd.DataFrame): The dataframe with the user input that is one-hot-encoded.
@@ -165,22 +325,233 @@ def app_input_one_hot_encode(prediction_df: pd.DataFrame,
     Raises:
         KeyError: This function raises a KeyError if the columns expected by the one hot encoder are not present in the
         dataframe.
+        ValueError: This function raises a ValueError if the number of columns does not match the one hot encoder or if
+            a value is a category the one hot encoder has not seen and the encoder does not ignore unknown categories.
+
+    """
+
+    # Attempt to select the columns to one hot encode
+    try:
+        one_hot_input = prediction_df[one_hot_encode_columns]
+    except KeyError as key_error:
+        logger.error("Could not one-hot-encode the user input. "
+                     "The one-hot-encode columns specified do not exist in the data. %s", key_error)
+        raise key_error
+
+    if one_hot_lookup is None:
+        one_hot_lookup = one_hot_lookup_tables(one_hot_encoder)
+    if len(one_hot_encode_columns) != len(one_hot_lookup):
+        logger.error("Could not one-hot-encode the user input. %d columns were given, but the one hot encoder expects "
+                     "%d columns.", len(one_hot_encode_columns), len(one_hot_lookup))
+        raise ValueError("The number of columns to one-hot-encode does not match the one hot encoder.")
+
+    # Look up the one hot encoded rows for each column using the category codes. Unknown categories have a code of -1,
+    # which wraps around to the row of zeros at the end of each table. The rows are written straight into one output
+    # array rather than stacking a separate array for each column.
+    one_hot_array = np.empty((len(one_hot_input.index), sum(table.shape[1] for _, _, table in one_hot_lookup)),
+                             dtype=one_hot_encoder.dtype)
+    start = 0
+    single_row = len(one_hot_input.index) == 1
+    for column_name, (category_dtype, category_codes, one_hot_table) in zip(one_hot_encode_columns, one_hot_lookup):
+        if single_row:
+            codes = np.array([category_codes.get(one_hot_input[column_name].iat[0], -1)])
+        else:
+            codes = pd.Categorical(one_hot_input[column_name], dtype=category_dtype).codes
+        if one_hot_encoder.handle_unknown == "error" and (codes < 0).any():
+            logger.error("Could not one-hot-encode the user input. Found an unknown category in '%s'.", column_name)
+            raise ValueError(f"Found an unknown category in '{column_name}'.")
+        stop = start + one_hot_table.shape[1]
+        np.take(one_hot_table, codes, axis=0, out=one_hot_array[:, start:stop], mode="wrap")
+        start = stop
+
+    # Drop the columns not needed after one-hot-encoding and place the one hot encoded data next to the remaining
+    # columns. Sharing the index of the input avoids the index alignment that a join would perform.
+    if one_hot_column_names is None:
+        one_hot_column_names = one_hot_encoder.get_feature_names_out()
+    one_hot_df = pd.DataFrame(one_hot_array, columns=one_hot_column_names, index=prediction_df.index)
+    data_one_hot_encoded = pd.concat([prediction_df.drop(columns=one_hot_encode_columns), one_hot_df],
+                                     axis=1, copy=False)
+    logger.debug("One Hot Encoded the new data. The data has %d rows and %d columns.", *data_one_hot_encoded.shape)
+
+    return data_one_hot_encoded
+
+
+def one_hot_lookup_tables(one_hot_encoder: sklearn.preprocessing.OneHotEncoder
+                          ) -> typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]:
+    """This function builds the lookup tables used to one-hot-encode data without calling the encoder's transform
+    method. For each column the encoder was fit on, it creates a categorical data type with the encoder's categories,
+    a dictionary mapping each category to its code, and a table where row i is the one hot encoding of category i.
+    Columns dropped by the encoder are removed from the table, and a final row of zeros is added so that unknown
+    categories (code -1) map to all zeros.
+
+    Args:
+        one_hot_encoder (sklearn.preprocessing.OneHotEncoder): A fit one-hot-encoder.
+
+    Returns:
+        one_hot_lookup (typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]): A list with one
+            (categorical data type, category codes, one hot table) tuple for each column, in the order the encoder was
+            fit on.
 
     """
+    drop_idx = one_hot_encoder.drop_idx_
+    one_hot_lookup = []
+    for column_index, categories in enumerate(one_hot_encoder.categories_):
+        one_hot_table = np.eye(len(categories) + 1, len(categories), dtype=one_hot_encoder.dtype)
+        if drop_idx is not None and drop_idx[column_index] is not None:
+            one_hot_table = np.delete(one_hot_table, drop_idx[column_index], axis=1)
+        category_codes = {category: code for code, category in enumerate(categories.tolist())}
+        one_hot_lookup.append((pd.CategoricalDtype(categories=categories), category_codes, one_hot_table))
+    return one_hot_lookup
+
+
+def app_input_record_transformations(record: dict,
+                                     binarize_column_params: dict,
+                                     log_transform_params: dict,
+                                     remove_outlier_params: dict,
+                                     temperature_column: str) -> dict:
+    """This function performs the same transformations as app_input_transformations on a single query stored as a
+    dictionary. It binarizes columns, log-transforms columns, converts fahrenheit to kelvin, drops the original columns,
+    and validates the result. Working on the dictionary avoids creating a dataframe for each step.
+
+    Args:
+        record (dict): The user input as a dictionary. It is modified in place.
+        binarize_column_params (dict): The parameters needed to binarize the columns.
+        log_transform_params (dict): The parameters needed to log-transform the columns.
+        remove_outlier_params (dict): The parameters needed to validate the user input.
+        temperature_column (str): The name of the column containing the temperature.
 
-    # Attempt to one hot encode the new data
+    Returns:
+        record (dict): The user input after the transformations. New columns are added at the end in the same order
+            as app_input_transformations adds them.
+
+    Raises:
+        KeyError: This function raises a key error if one of the required columns for the feature transformations
+            does not exist in the user input.
+        TypeError: This function raises a type error if one of the columns contains an unexpected datatype.
+        ValueError: This function raises a value error if the user input is outside of the valid range of values.
+
+    """
+    # Binarize columns, log transform columns, and convert fahrenheit to kelvin with the same helpers used for a
+    # dataframe. The converted temperature replaces the original value and the new columns are added at the end.
     try:
-        one_hot_array = one_hot_encoder.transform(prediction_df[one_hot_encode_columns])
+        record.update(_transformed_values(record,
+                                          binarize_column_params=binarize_column_params,
+                                          log_transform_params=log_transform_params,
+                                          temperature_column=temperature_column))
+    except (TypeError, KeyError) as transform_error:
+        # This error will occur if a column to transform is missing or a value is not numeric where it needs to be.
+        logger.error("Failed to transform the user input.")
+        raise transform_error
+
+    # Drop columns not needed after transformations
+    cols_drop = list(log_transform_params["log_transform_column_names"]) + \
+        list(binarize_column_params["binarize_column_names"])
+    for column_drop in cols_drop:
+        record.pop(column_drop, None)
+
+    # Validate the user input. An invalid query cannot be predicted, so a ValueError is raised.
+    try:
+        src.remove_outliers.validate_record(record,
+                                            **remove_outlier_params["feature_columns"],
+                                            **remove_outlier_params["valid_values"],
+                                            include_response=False)
+    except (KeyError, TypeError) as validate_record_error:
+        logger.error("Failed to validate the user input.")
+        raise validate_record_error
+    except ValueError as val_error:
+        logger.error("The user input is outside of the valid range of values.")
+        raise val_error
+    logger.debug("Transformed and validated the user input.")
+
+    return record
+
+
+def app_input_record_one_hot_encode(record: dict,
+                                    one_hot_encoder: sklearn.preprocessing.OneHotEncoder,
+                                    one_hot_encode_columns: typing.List,
+                                    output_dtype: typing.Optional[str] = None,
+                                    one_hot_column_names: typing.Optional[typing.Sequence] = None,
+                                    one_hot_lookup: typing.Optional[
+                                        typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]] = None
+                                    ) -> pd.DataFrame:
+    """This function one-hot-encodes a single query stored as a dictionary and returns it as a one row dataframe. The
+    one hot encoded values are looked up in the tables built by one_hot_lookup_tables. The columns are in the same
+    order as the output of app_input_one_hot_encode.
+
+    Args:
+        record (dict): The transformed user input as a dictionary.
+        one_hot_encoder (sklearn.preprocessing.OneHotEncoder): The one-hot-encoder object to use to transform the data.
+        one_hot_encode_columns (typing.List): The list of columns to one-hot-encode.
+        output_dtype (typing.Optional[str]): The data type of the output dataframe, such as 'float32'. If None, the
+            data type of each column is inferred. Defaults to None.
+        one_hot_column_names (typing.Optional[typing.Sequence]): The names of the one hot encoded output columns. If
+            None, they are computed from the encoder. Defaults to None.
+        one_hot_lookup (typing.Optional[typing.List[typing.Tuple[pd.CategoricalDtype, dict, np.ndarray]]]): The
+            lookup tables built by one_hot_lookup_tables for the encoder. If None, they are built from the encoder.
+            Defaults to None.
+
+    Returns:
+        data_one_hot_encoded (pd.DataFrame): A one row dataframe with the user input that is one-hot-encoded.
+
+    Raises:
+        KeyError: This function raises a KeyError if the columns expected by the one hot encoder are not present in the
+            user input.
+        ValueError: This function raises a ValueError if the number of columns does not match the one hot encoder, if
+            a value is a category the one hot encoder has not seen and the encoder does not ignore unknown categories,
+            or if the values cannot be converted to the output data type.
+
+    """
+    # Attempt to select the values to one hot encode
+    try:
+        one_hot_values = [record[column_name] for column_name in one_hot_encode_columns]
     except KeyError as key_error:
         logger.error("Could not one-hot-encode the user input. "
                      "The one-hot-encode columns specified do not exist in the data. %s", key_error)
         raise key_error
 
-    # Join the one hot encoded data back with the original data and drop the columns not needed after one-hot-encoding.
-    one_hot_column_names = one_hot_encoder.get_feature_names_out()
-    one_hot_df = pd.DataFrame(one_hot_array, columns=one_hot_column_names)
-    data_one_hot_encoded = prediction_df.join(one_hot_df).drop(one_hot_encode_columns, axis=1)
-    logger.info("One Hot Encoded the new data")
+    if one_hot_lookup is None:
+        one_hot_lookup = one_hot_lookup_tables(one_hot_encoder)
+    if len(one_hot_encode_columns) != len(one_hot_lookup):
+        logger.error("Could not one-hot-encode the user input. %d columns were given, but the one hot encoder expects "
+                     "%d columns.", len(one_hot_encode_columns), len(one_hot_lookup))
+        raise ValueError("The number of columns to one-hot-encode does not match the one hot encoder.")
+
+    # Keep the columns that are not one-hot-encoded in their current order, followed by the one hot encoded columns.
+    if one_hot_column_names is None:
+        one_hot_column_names = one_hot_encoder.get_feature_names_out()
+    other_column_names = [column_name for column_name in record if column_name not in one_hot_encode_columns]
+    column_names = [*other_column_names, *one_hot_column_names]
+    other_values = [record[column_name] for column_name in other_column_names]
+
+    # The one hot encoded values are written into one preallocated row. Unknown categories have a code of -1, which
+    # selects the row of zeros at the end of each table.
+    one_hot_row = np.empty(len(column_names) - len(other_column_names), dtype=one_hot_encoder.dtype)
+    start = 0
+    for column_name, value, (_, category_codes, one_hot_table) in zip(one_hot_encode_columns, one_hot_values,
+                                                                       one_hot_lookup):
+        code = category_codes.get(value, -1)
+        if code < 0 and one_hot_encoder.handle_unknown == "error":
+            logger.error("Could not one-hot-encode the user input. Found an unknown category in '%s'.", column_name)
+            raise ValueError(f"Found an unknown category in '{column_name}'.")
+        stop = start + one_hot_table.shape[1]
+        one_hot_row[start:stop] = one_hot_table[code]
+        start = stop
+
+    # With an output data type, the values are written into one array so the dataframe holds a single block.
+    # Otherwise, the data type of each column is inferred, as it is when one-hot-encoding a dataframe.
+    if output_dtype is not None:
+        try:
+            row = np.empty((1, len(column_names)), dtype=output_dtype)
+            row[0, :len(other_values)] = other_values
+            row[0, len(other_values):] = one_hot_row
+        except (TypeError, ValueError) as astype_error:
+            # This error will occur if the data type is invalid or a value cannot be converted to it.
+            logger.error("Failed to cast the preprocessed user input to %s.", output_dtype)
+            raise astype_error
+        data_one_hot_encoded = pd.DataFrame(row, columns=column_names)
+    else:
+        data_one_hot_encoded = pd.DataFrame([other_values + one_hot_row.tolist()], columns=column_names)
+    logger.debug("One Hot Encoded the user input. The data has %d columns.", len(column_names))
 
     return data_one_hot_encoded
 
@@ -206,30 +577,23 @@ def validate_app_input(input_dict: dict, validate_user_input_params: dict) -> di
         ValueError: This function raises a ValueError if the input user parameters cannot be validated.
 
     """
-    valid_input = True
-
     # Check that the input argument is a dictionary
     if not isinstance(input_dict, dict):
         logger.error("Invalid data type. The input data is not in the form of dictionary.")
-        valid_input = False
+        raise ValueError("The input data could not be validated.")
 
     # Check that the dictionary is not empty.
-    elif not len(input_dict) > 0:
+    if not input_dict:
         logger.error("The input data is empty.")
-        valid_input = False
-
-    # Validate the input data
-    else:
-        try:
-            # Validate the data type and that the columns exist
-            input_dict = validate_app_input_dtype(input_dict, **validate_user_input_params)
-        except ValueError:
-            valid_input = False
-            logger.error("The input data's data types could not be validated.")
-
-    # If data validation fails, raise a ValueError
-    if not valid_input:
         raise ValueError("The input data could not be validated.")
+
+    # Validate the data type and that the columns exist
+    try:
+        input_dict = validate_app_input_dtype(input_dict, **validate_user_input_params)
+    except ValueError as val_error:
+        logger.error("The input data's data types could not be validated.")
+        raise ValueError("The input data could not be validated.") from val_error
+
     return input_dict
 
 
@@ -253,35 +617,59 @@ def validate_app_input_dtype(input_dict: dict,
             expected values cannot be transformed to the expected data type.
 
     """
-    new_query_params = {}
-    valid_input = True
-
-    # For every column
-    for col in column_names:
-        # If the column is expected to be a float, try to cast it to a float.
-        if col in float_columns:
-            try:
-                new_query_params[col] = float(input_dict[col])
-            except ValueError:
-                logger.error("A float was not entered for %s.", col)
-                valid_input = False
-            except KeyError:
-                logger.error("%s was not a field found in the input data.", col)
-                valid_input = False
-
-        # Else, try to cast it to a string if it is not expected to be numeric.
-        else:
-            try:
-                new_query_params[col] = str(input_dict[col])
-            except ValueError:
-                logger.error("A string was not entered for %s.", col)
-                valid_input = False
-            except KeyError:
-                logger.error("%s was not a field found in the input data.", col)
-                valid_input = False
-
-    # If the user input cannot be validated, raise a value error.
-    if not valid_input:
+    # Look up the (column, caster) schema table once instead of deciding the data type inside a try block per column.
+    schema = _input_dtype_schema(tuple(column_names), tuple(float_columns))
+
+    # Check that every expected column is present before casting any values, and report all missing columns at once.
+    missing_columns = [col for col, _ in schema if col not in input_dict]
+    if missing_columns:
+        logger.error("%s was not a field found in the input data.", ", ".join(missing_columns))
         raise ValueError("The input data types were not valid.")
 
+    # Cast every value in one pass. The column that failed is only searched for if a value could not be cast.
+    try:
+        new_query_params = {col: caster(input_dict[col]) for col, caster in schema}
+    except ValueError as val_error:
+        invalid_columns = [col for col, caster in schema if not _can_cast(caster, input_dict[col])]
+        logger.error("A value of the expected data type was not entered for %s.", ", ".join(invalid_columns))
+        raise ValueError("The input data types were not valid.") from val_error
+
     return new_query_params
+
+
+def _can_cast(caster: typing.Callable, value: typing.Any) -> bool:
+    """This helper function checks whether a value from the user input can be cast to the expected data type. It is
+    only used to find which columns were invalid after casting the user input fails.
+
+    Args:
+        caster (typing.Callable): The function used to cast the value, such as float.
+        value (typing.Any): The value from the user input.
+
+    Returns:
+        can_cast (bool): True if the value can be cast, otherwise False.
+
+    """
+    try:
+        caster(value)
+    except ValueError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=8)
+def _input_dtype_schema(column_names: typing.Tuple,
+                        float_columns: typing.Tuple) -> typing.Tuple[typing.Tuple[str, typing.Callable], ...]:
+    """This helper function builds the schema table used to validate the user input. Each entry pairs an expected
+    column with the function used to cast its value. The table only depends on the configuration, so it is cached.
+
+    Args:
+        column_names (typing.Tuple): The keys that are expected to be in the user input.
+        float_columns (typing.Tuple): The keys that are expected to have numeric values.
+
+    Returns:
+        schema (typing.Tuple[typing.Tuple[str, typing.Callable], ...]): A tuple of (column name, caster) pairs.
+
+    """
+    float_column_set = frozenset(float_columns)
+    schema = tuple((col, float if col in float_column_set else str) for col in column_names)
+    return schema
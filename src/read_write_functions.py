@@ -1,3 +1,4 @@
+import functools
 import logging.config
 import typing
 import os
@@ -5,14 +6,22 @@ import urllib.error
 
 import yaml
 import pandas as pd
-import joblib
-import sklearn
+
+# joblib and sklearn are only needed to load and save model objects, so joblib is imported inside those functions
+# and sklearn is only imported for type checking. Processes that only read configuration or data do not import them.
+if typing.TYPE_CHECKING:
+    import sklearn.base
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml C loader if it is available. Both loaders only construct plain Python objects.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def read_yaml(config_path: str) -> dict:
-    """This function reads in a configuration yaml file and returns a dictionary
+    """This function reads in a configuration yaml file and returns a dictionary. The parsed file is cached, keyed on
+    the path and the time the file was last modified, so repeated reads of an unchanged file (such as on every web app
+    request) do not parse the file again. The returned dictionary is shared between callers and should not be modified.
 
     Args:
         config_path (str): Path to the configuration yaml file.
@@ -24,14 +33,32 @@ def read_yaml(config_path: str) -> dict:
         FileNotFoundError: This function raises a FileNotFoundError if the YAML file cannot be located.
 
     """
-    try:
-        with open(config_path, encoding="utf-8") as config_file:
-            config_dict = yaml.safe_load(config_file)
-    except FileNotFoundError as file_not_found:
-        logger.error("Could not locate the specified configuration file. %s", file_not_found)
-        raise file_not_found
-    else:
-        logger.info("Successfully loaded configuration file.")
+    # Check that the file exists up front rather than relying on the error raised when it is opened.
+    config_path = os.path.abspath(config_path)
+    if not os.path.isfile(config_path):
+        logger.error("Could not locate the specified configuration file. %s", config_path)
+        raise FileNotFoundError(f"No configuration file found at {config_path}")
+
+    config_dict = _read_yaml_cached(config_path, os.stat(config_path).st_mtime_ns)
+    logger.info("Successfully loaded configuration file.")
+    return config_dict
+
+
+@functools.lru_cache(maxsize=32)
+def _read_yaml_cached(config_path: str, modified_time_ns: int) -> dict:
+    """This helper function parses a configuration yaml file. It uses the libyaml C loader when PyYAML was built with
+    it, which is much faster than the pure Python loader.
+
+    Args:
+        config_path (str): The absolute path to the configuration yaml file.
+        modified_time_ns (int): The time the file was last modified. It is only used as part of the cache key.
+
+    Returns:
+        config_dict (dict): A dictionary containing the contents of the yaml file
+
+    """
+    with open(config_path, encoding="utf-8") as config_file:
+        config_dict = yaml.load(config_file, Loader=_YAML_LOADER)
     return config_dict
 
 
@@ -85,7 +112,9 @@ def read_csv(input_source: str) -> pd.DataFrame:
     """
     data_input = pd.DataFrame()
     try:
-        data_input = pd.read_csv(input_source)
+        # Memory map local files so the parser reads directly from the mapped file instead of through a buffered
+        # file object. Other sources, such as S3 paths, are read as usual.
+        data_input = pd.read_csv(input_source, memory_map=os.path.isfile(input_source))
     except FileNotFoundError as file_not_found:
         logger.error("Could not read the file from the directory. %s", file_not_found)
     except pd.errors.ParserError:
@@ -101,7 +130,7 @@ def read_csv(input_source: str) -> pd.DataFrame:
     return data_input
 
 
-def load_model_object(model_input_source: str) -> sklearn.base.BaseEstimator:
+def load_model_object(model_input_source: str) -> "sklearn.base.BaseEstimator":
     """This function loads a sklearn model object stored in a joblib file.
         It can be used to load in trained model objects.
 
@@ -115,6 +144,12 @@ def load_model_object(model_input_source: str) -> sklearn.base.BaseEstimator:
         ValueError: This function raises a value error if the model cannot be read in. This can occur for several
             reasons including the file not being found or the file not being a proper joblib file.
     """
+    # Check that the file exists up front rather than relying on the error raised when it is opened.
+    if not os.path.isfile(model_input_source):
+        logger.error("Could not read the file from the directory. No file found at %s", model_input_source)
+        raise ValueError("Failed to read in the model object.")
+
+    import joblib
     model = None
     try:
         model = joblib.load(model_input_source)
@@ -149,12 +184,11 @@ def save_csv(data: typing.Union[pd.DataFrame, pd.Series], output_path: str) -> N
     except OSError as os_error:
         logger.error("Failed to save data because the folder does not exist. %s", os_error)
     else:
-        try:
+        # A pandas series has a one dimensional shape, so log an alternative message for it.
+        if isinstance(data, pd.DataFrame):
             logger.info("Successfully saved csv file with %d columns and %d rows to %s.",
                         data.shape[0], data.shape[1], output_path)
-        except IndexError:
-            # If the data is a pandas series, trying to log data.shape will throw an index error, so log an alternative
-            # message if the IndexError arises.
+        else:
             logger.info("Successfully saved csv file with 1 column and %d rows to %s.",
                         data.size, output_path)
 
@@ -163,18 +197,24 @@ def save_csv(data: typing.Union[pd.DataFrame, pd.Series], output_path: str) -> N
         logger.warning("Warning: saving to a non-csv file format.")
 
 
-def save_model_object(model: sklearn.base.BaseEstimator, output_path: str) -> None:
+def save_model_object(model: "sklearn.base.BaseEstimator",
+                      output_path: str,
+                      compress: typing.Union[int, typing.Tuple[str, int]] = 0) -> None:
     """This function saves a sklearn model object as a joblib file to a specified output path.
 
     Args:
         model (sklearn.base.BaseEstimator): The sklearn model object to save to the file.
         output_path (str): The output path to which to save the joblib file.
+        compress (typing.Union[int, typing.Tuple[str, int]]): The joblib compression to use, either a zlib level from
+            0 to 9 or a (method, level) tuple such as ('gzip', 3). Compressed files are smaller and faster to copy to
+            and from S3, but take longer to write and to load. Defaults to 0 (no compression).
 
     Returns:
         This function does not return any object.
     """
+    import joblib
     try:
-        joblib.dump(model, output_path)
+        joblib.dump(model, output_path, compress=compress)
     except OSError as os_error:
         logger.error("Saving model object failed because the output folder does not exist. %s", os_error)
     else:
@@ -194,9 +234,8 @@ def save_dict_as_text(data: dict, output_path: str) -> None:
     """
     try:
         with open(output_path, "w", encoding="utf-8") as data_file:
-            # for each key-value pair, write it as a new line.
-            for metric, value in data.items():
-                data_file.write(metric + ": " + str(value) + "\n")
+            # Build the text with each key-value pair on a new line, then write it in one call.
+            data_file.write("".join(f"{metric}: {value}\n" for metric, value in data.items()))
     except OSError as os_error:
         logger.error("Failed to save text file because the folder does not exist. %s", os_error)
     else:
@@ -1,6 +1,7 @@
 import logging
 import typing
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -65,34 +66,52 @@ def remove_outliers(data: pd.DataFrame,
     Raises:
         KeyError: This function raises a KeyError if the column specified does not exist in the dataframe.
         TypeError: This function raises a TypeError if one of the minimum/maximum values does not match the datatype
-            it is comparing to.
+            it is comparing to. Columns that are not checked because no records are left only raise a TypeError if
+            their minimum/maximum values are not numeric.
+        ValueError: This function raises a ValueError if the valid weather or week days are None.
     """
     data_shape = data.shape
 
-    # I wrap all 8 calls to filter_data into one try block because it is un-necessary to catch exceptions from each
-    # separate call individually. The exception handling and logging in filter_data alerts users to the specific error
-    # that occurs, and this try block just catches and re-raises the individual errors from filter_data.
-    # So if I am handling exceptions from filter_data in the same way for all calls to filter data,
-    # I can just catch and handle it once rather than with 8 separate try-except blocks.
+    # The checks are ordered so that the category checks, which usually remove the most records, run first. Once no
+    # records are left, the remaining checks are skipped.
+    checks = [dict(column_name=weather_column, valid_categories=valid_weather, categorical=True),
+              dict(column_name=day_of_week_column, valid_categories=valid_week_days, categorical=True),
+              dict(column_name=temperature_column, min_value=temp_min, max_value=temp_max),
+              dict(column_name=rain_column, min_value=log_rain_mm_min, max_value=log_rain_mm_max),
+              dict(column_name=clouds_column, min_value=clouds_min, max_value=clouds_max),
+              dict(column_name=hour_column, min_value=hours_min, max_value=hours_max),
+              dict(column_name=month_column, min_value=month_min, max_value=month_max)]
+    if include_response:
+        checks.insert(2, dict(column_name=response_column, min_value=response_min, max_value=response_max))
+
+    # Check that every column exists before any checks are skipped, so that a missing column is always reported.
+    missing_columns = [check["column_name"] for check in checks if check["column_name"] not in data.columns]
+    if missing_columns:
+        logger.error("Failed to remove outliers. The columns %s do not exist in the dataframe.", missing_columns)
+        raise KeyError(missing_columns)
+
+    # I wrap all calls to filter_mask into one try block because it is un-necessary to catch exceptions from each
+    # separate call individually. The exception handling and logging in filter_mask alerts users to the specific error
+    # that occurs, and this try block just catches and re-raises the individual errors from filter_mask.
+    # The masks for every column are numpy arrays that are combined in place, and the dataframe is indexed only once at
+    # the end, rather than copying the surviving rows of the dataframe after every column is filtered.
+    # The parameters of every check are validated before any check is skipped, so that a misconfigured check is
+    # reported on every dataset, not only on those that still have records left when the check is reached.
+    mask = np.ones(data_shape[0], dtype=bool)
     try:
-        data = filter_data(data, column_name=temperature_column, min_value=temp_min, max_value=temp_max)
-        data = filter_data(data, column_name=rain_column, min_value=log_rain_mm_min, max_value=log_rain_mm_max)
-        data = filter_data(data, column_name=clouds_column, min_value=clouds_min, max_value=clouds_max)
-        data = filter_data(data, column_name=hour_column, min_value=hours_min, max_value=hours_max)
-        data = filter_data(data, column_name=month_column, min_value=month_min, max_value=month_max)
-        data = filter_data(data, column_name=weather_column, valid_categories=valid_weather, categorical=True)
-        data = filter_data(data, column_name=day_of_week_column, valid_categories=valid_week_days, categorical=True)
-        if include_response:
-            data = filter_data(data, column_name=response_column, min_value=response_min, max_value=response_max)
-    except KeyError as key_error:
-        # This error can occur if the specified columns do not exist in the dataframe.
-        logger.error("Failed to remove outliers. One of the columns specified does not exist in the dataframe.")
-        raise key_error
+        for check in checks:
+            _validate_filter_params(**check)
+        for check in checks:
+            mask &= filter_mask(data, **check)
+            if not mask.any():
+                break
     except TypeError as type_error:
         # This error can occur if the datatype of the min/max values do not match the datatype of the column.
         logger.error("Failed to remove outliers. One of the input parameters is of the wrong type.")
         raise type_error
 
+    data = data[mask]
+
     data_outlier_shape = data.shape
 
     if data.empty:
@@ -111,7 +130,7 @@ def filter_data(data: pd.DataFrame,
                 column_name: str,
                 min_value: float = 0,
                 max_value: float = 0,
-                valid_categories: typing.List = None,
+                valid_categories: typing.Optional[typing.Iterable[str]] = None,
                 categorical: bool = False) -> pd.DataFrame:
     """This function filters an input dataframe for values of the specified column that are in between the min and max
         values specified or are in the list of valid categories.
@@ -121,7 +140,8 @@ def filter_data(data: pd.DataFrame,
         column_name (str): The name of the column to filter.
         min_value (float): The minimum allowable value to filter for. Only required for numeric columns.
         max_value (float):  The maximum allowable value to filter for. Only required for numeric columns.
-        valid_categories (typing.List): The list of valid categories. Only used for categorical variables.
+        valid_categories (typing.Optional[typing.Iterable[str]]): The valid categories. Only used for categorical
+            variables and required when categorical is True. Defaults to None.
         categorical (bool): A boolean indicating if the column is categorical. Default is False.
 
     Returns:
@@ -129,45 +149,210 @@ def filter_data(data: pd.DataFrame,
 
     Raises:
         KeyError: This function raises a KeyError if the column specified is not found in the dataframe.
-        TypeError: This function raises a TypeError if the minimum/maximum value specified is different from the data
-            type in the column.
+        TypeError: This function raises a TypeError if the minimum/maximum values are not numeric or cannot be
+            compared with the values in the column.
+        ValueError: This function raises a ValueError if the column is categorical and no valid categories are given.
+
+    """
+    mask = filter_mask(data, column_name, min_value, max_value, valid_categories, categorical)
+
+    # Only count the removed records when the debug message will be logged.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Removed %d records that matched the outlier criteria for '%s'.",
+                     mask.size - np.count_nonzero(mask),
+                     column_name)
+
+    return data[mask]
+
+
+def filter_mask(data: pd.DataFrame,
+                column_name: str,
+                min_value: float = 0,
+                max_value: float = 0,
+                valid_categories: typing.Optional[typing.Iterable[str]] = None,
+                categorical: bool = False) -> np.ndarray:
+    """This function creates a boolean mask of the rows of an input dataframe where the values of the specified column
+        are in between the min and max values specified or are in the list of valid categories. The dataframe itself
+        is not copied, so the masks for several columns can be combined before the dataframe is filtered once. Columns
+        with a categorical data type are checked using their integer codes, which is faster than comparing strings.
+
+    Args:
+        data (pd.DataFrame): An input pandas dataframe
+        column_name (str): The name of the column to check.
+        min_value (float): The minimum allowable value. Only required for numeric columns.
+        max_value (float):  The maximum allowable value. Only required for numeric columns.
+        valid_categories (typing.Optional[typing.Iterable[str]]): The valid categories. Only used for categorical
+            variables and required when categorical is True. Defaults to None.
+        categorical (bool): A boolean indicating if the column is categorical. Default is False.
+
+    Returns:
+        mask (np.ndarray): A boolean array that is True for the rows with valid values of the column.
+
+    Raises:
+        KeyError: This function raises a KeyError if the column specified is not found in the dataframe.
+        TypeError: This function raises a TypeError if the minimum/maximum values are not numeric or cannot be
+            compared with the values in the column.
+        ValueError: This function raises a ValueError if the column is categorical and no valid categories are given.
 
     """
-    initial_shape = data.shape
+    # Validate the column and the parameters once up front. A column whose values cannot be compared to the min/max
+    # values is reported by the comparison itself below.
+    if column_name not in data.columns:
+        logger.error("The column '%s' does not exist in the dataframe.", column_name)
+        raise KeyError(column_name)
+    column = data[column_name]
+    _validate_filter_params(column_name, min_value, max_value, valid_categories, categorical)
 
-    # Filter numeric columns based on min/max values.
+    # Check numeric columns against the min/max values. Columns with a numpy numeric data type are compared as arrays.
+    # Other columns, such as object columns holding numbers or nullable integer columns, are compared by pandas, and
+    # missing values are treated as invalid.
     if not categorical:
-        # Key Errors occur if the column does not exist in the dataframe.
-        # Type Errors occur if the data type of the column does not match the min/max values passed.
         try:
-            data = data[data[column_name] >= min_value]
-        except KeyError as key_error:
-            logger.error("The column '%s' does not exist in the dataframe.", column_name)
-            raise key_error
+            if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_extension_array_dtype(column):
+                values = column.to_numpy()
+                mask = values >= min_value
+                mask &= values <= max_value
+            else:
+                mask = ((column >= min_value) & (column <= max_value)).to_numpy(dtype=bool, na_value=False)
         except TypeError as type_error:
             logger.error("The column '%s' could not be filtered because the data type of the column did "
-                         "not match the data type of the min value.", column_name)
-            raise type_error
-        try:
-            data = data[data[column_name] <= max_value]
-        except KeyError as key_error:
-            logger.error("The column '%s' does not exist in the dataframe.", column_name)
-            raise key_error
-        except TypeError as type_error:
-            logger.error("The column '%s' could not be filtered because the data type of the column did "
-                         "not match the data type of the max value.", column_name)
+                         "not match the data type of the min/max values.", column_name)
             raise type_error
 
-    # Filter categorical column using the list of valid categories
+    # Check categorical column against the list of valid categories. For a categorical column, only the few categories
+    # are compared against the valid categories, and each row then looks up the result by its integer code. The extra
+    # False at the end is selected by the code -1, which pandas uses for missing values.
     else:
-        try:
-            data = data[data[column_name].isin(valid_categories)]
-        except KeyError as key_error:
-            logger.error("The column '%s' does not exist in the dataframe.", column_name)
-            raise key_error
+        valid_categories = pd.Index(valid_categories)
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            valid_codes = np.append(column.cat.categories.isin(valid_categories), False)
+            mask = valid_codes[column.cat.codes.to_numpy()]
+        else:
+            mask = column.isin(valid_categories).to_numpy()
 
-    logger.debug("Removed %d records that matched the outlier criteria for '%s'.",
-                 initial_shape[0] - data.shape[0],
-                 column_name)
+    return mask
 
-    return data
+
+def _validate_filter_params(column_name: str,
+                            min_value: float = 0,
+                            max_value: float = 0,
+                            valid_categories: typing.Optional[typing.Iterable[str]] = None,
+                            categorical: bool = False) -> None:
+    """This helper function checks the parameters of one filter_mask check without looking at the data, so that a
+    misconfigured check is reported even when there are no records left to check.
+
+    Args:
+        column_name (str): The name of the column to check.
+        min_value (float): The minimum allowable value. Only required for numeric columns.
+        max_value (float):  The maximum allowable value. Only required for numeric columns.
+        valid_categories (typing.Optional[typing.Iterable[str]]): The valid categories. Only used for categorical
+            variables and required when categorical is True. Defaults to None.
+        categorical (bool): A boolean indicating if the column is categorical. Default is False.
+
+    Returns:
+        This function does not return any objects.
+
+    Raises:
+        TypeError: This function raises a TypeError if the column is numeric and the minimum/maximum values are not
+            numeric.
+        ValueError: This function raises a ValueError if the column is categorical and no valid categories are given.
+
+    """
+    if not categorical and not (pd.api.types.is_number(min_value) and pd.api.types.is_number(max_value)):
+        logger.error("The column '%s' could not be filtered because the min/max values are not numeric.", column_name)
+        raise TypeError(f"The min/max values for the column '{column_name}' must be numeric.")
+    if categorical and valid_categories is None:
+        logger.error("The column '%s' could not be filtered because no valid categories were given.", column_name)
+        raise ValueError(f"The valid categories for the column '{column_name}' must be given.")
+
+
+def validate_record(record: typing.Mapping,
+                    weather_column: str,
+                    day_of_week_column: str,
+                    temperature_column: str,
+                    clouds_column: str,
+                    rain_column: str,
+                    hour_column: str,
+                    month_column: str,
+                    temp_min: float,
+                    temp_max: float,
+                    log_rain_mm_min: float,
+                    log_rain_mm_max: float,
+                    clouds_min: float,
+                    clouds_max: float,
+                    hours_min: int,
+                    hours_max: int,
+                    month_min: int,
+                    month_max: int,
+                    valid_week_days: typing.List,
+                    valid_weather: typing.List,
+                    response_min: float = 0,
+                    response_max: float = 10000,
+                    response_column: str = "traffic_volume",
+                    include_response: bool = True) -> None:
+    """This function checks a single record against the same min/max allowable values and valid categories used by
+    remove_outliers. It compares scalar values directly, so it is much cheaper than filtering a dataframe when there is
+    only one record to check, such as a query from the web application.
+
+    Args:
+        record (typing.Mapping): The record to check, such as a dictionary or a row of a dataframe.
+        weather_column (str): The name of the column containing the weather.
+        day_of_week_column (str): The name of the column containing the day of the week.
+        temperature_column (str): The name of the column containing the temperature.
+        clouds_column (str): The name of the column containing the clouds.
+        rain_column (str): The name of the column containing the rain last hour information.
+        hour_column (str): The name of the column containing the hour.
+        month_column (str): The name of the column containing the month.
+        temp_min (float): The minimum allowable temperature.
+        temp_max (float): The maximum allowable temperature.
+        log_rain_mm_min (float): The minimum allowable log_rain
+        log_rain_mm_max (float): The maximum allowable log_rain
+        clouds_min (float): The minimum allowable cloud percentage
+        clouds_max (float): The maximum allowable cloud percentage
+        hours_min (int): The minimum allowable hour
+        hours_max (int): The maximum allowable hour
+        month_min (int): The minimum allowable month
+        month_max (int): The maximum allowable month
+        valid_week_days (typing.List): A list of valid week days
+        valid_weather (typing.List): A list of valid weather categories
+        response_min (float): The minimum allowable value for the response column.
+        response_max (float): The maximum allowable value for the response column.
+        response_column (str): The name of the response column.
+        include_response (bool): Boolean indicating whether the response column is included in the record.
+
+    Returns:
+        This function does not return any object.
+
+    Raises:
+        ValueError: This function raises a ValueError if any value of the record is outside of the allowable range or
+            is not a valid category.
+        KeyError: This function raises a KeyError if the column specified does not exist in the record.
+        TypeError: This function raises a TypeError if one of the minimum/maximum values does not match the datatype
+            it is comparing to.
+    """
+    numeric_bounds = [(temperature_column, temp_min, temp_max),
+                      (rain_column, log_rain_mm_min, log_rain_mm_max),
+                      (clouds_column, clouds_min, clouds_max),
+                      (hour_column, hours_min, hours_max),
+                      (month_column, month_min, month_max)]
+    if include_response:
+        numeric_bounds.append((response_column, response_min, response_max))
+    valid_categories = [(weather_column, valid_weather), (day_of_week_column, valid_week_days)]
+
+    try:
+        for column_name, min_value, max_value in numeric_bounds:
+            if not min_value <= record[column_name] <= max_value:
+                logger.error("The value of '%s' is outside of the allowable range.", column_name)
+                raise ValueError(f"The value of '{column_name}' is outside of the allowable range.")
+        for column_name, categories in valid_categories:
+            if record[column_name] not in categories:
+                logger.error("The value of '%s' is not a valid category.", column_name)
+                raise ValueError(f"The value of '{column_name}' is not a valid category.")
+    except KeyError as key_error:
+        # This error can occur if the specified columns do not exist in the record.
+        logger.error("Failed to validate the record. One of the columns specified does not exist in the record.")
+        raise key_error
+    except TypeError as type_error:
+        # This error can occur if the datatype of the min/max values do not match the datatype of the value.
+        logger.error("Failed to validate the record. One of the input parameters is of the wrong type.")
+        raise type_error
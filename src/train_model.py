@@ -1,5 +1,7 @@
 import logging
+import typing
 
+import numpy as np
 import pandas as pd
 import sklearn.ensemble
 from sklearn.ensemble import RandomForestRegressor
@@ -15,7 +17,9 @@ def train_model(train_data: pd.DataFrame,
                 max_features: int,
                 oob_score: bool,
                 n_jobs: int,
-                random_state: int) -> sklearn.ensemble.RandomForestRegressor:
+                random_state: int,
+                max_depth: typing.Optional[int] = None,
+                max_samples: typing.Optional[float] = None) -> sklearn.ensemble.RandomForestRegressor:
     """This function trains a Random Forest Regressor model from sklearn using input training data and specified
         parameters. See https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.RandomForestRegressor.html
         for more information.
@@ -27,10 +31,17 @@ def train_model(train_data: pd.DataFrame,
         criterion (str): The error criterion by which to split nodes in the tree.
         min_samples_split (int): The minimum number of samples required in a node to split the tree.
         max_features (int): The number of variables to randomly select at each split in the random forest.
-        oob_score (bool): Whether to calculate the training out-of-bag score.
+        oob_score (bool): Whether to calculate the training out-of-bag score. Calculating it adds a prediction pass
+            over the training data, and the model is evaluated on the held out test data anyway.
         n_jobs (int): The number of parallel jobs to run. For more information, see:
             https://scikit-learn.org/stable/modules/generated/sklearn.ensemble.RandomForestRegressor.html
         random_state (int): The random state for the random forest to ensure model reproducability.
+        max_depth (typing.Optional[int]): The maximum depth of each tree. Shallower trees are faster to fit and smaller
+            to save and load. Defaults to None, which grows each tree until its leaves are pure or smaller than
+            min_samples_split.
+        max_samples (typing.Optional[float]): The fraction of the training data (or, as an integer, the number of
+            records) drawn to fit each tree. Smaller samples make each tree faster to fit. Defaults to None, which
+            draws as many records as there are in the training data.
 
     Returns:
         rf_model (sklearn.ensemble.RandomForestRegressor): The trained random forest regressor model.
@@ -38,16 +49,15 @@ def train_model(train_data: pd.DataFrame,
     Raises:
         KeyError: A KeyError will be raised if the response column is not found in the training data.
         ValueError: A ValueError will be raised if fitting the Random Forest model fails because invalid parameters
-            were passed to the model object.
+            were passed to the model object or a predictor column is not numeric.
 
     """
-    # Separate the predictors and response.
-    try:
-        predictors = train_data.drop([response_column], axis=1)
-    except KeyError as key_error:
+    # Separate the predictors and response. Check for the response column up front rather than relying on the error
+    # from dropping it, so that no copy of the predictors is built before the error is raised.
+    if response_column not in train_data.columns:
         # This error will occur if the training data does not contain the response column.
-        logger.error("The specified response column does not exist in the training data. %s", key_error)
-        raise key_error
+        logger.error("The specified response column does not exist in the training data. '%s'", response_column)
+        raise KeyError(response_column)
     response = train_data[response_column]
 
     # Define the random forest model and attempt to fit it.
@@ -57,14 +67,27 @@ def train_model(train_data: pd.DataFrame,
                                      max_features=max_features,
                                      oob_score=oob_score,
                                      n_jobs=n_jobs,
-                                     random_state=random_state)
+                                     random_state=random_state,
+                                     max_depth=max_depth,
+                                     max_samples=max_samples)
     try:
+        # The predictors are built column by column as float32, because the random forest converts its input to
+        # float32 anyway. This avoids the float64 copy of the predictor matrix that dropping the response column would
+        # make. The column names are kept so that the model still checks them at prediction time.
+        predictors = pd.DataFrame({column: train_data[column].to_numpy(dtype=np.float32)
+                                   for column in train_data.columns if column != response_column},
+                                  index=train_data.index)
         rf_model.fit(X=predictors, y=response)
     except ValueError as val_error:
-        # This error can occur if the parameters of the Random Forest Model are in valid.
+        # This error can occur if the parameters of the Random Forest Model are in valid, or if a predictor column is
+        # not numeric.
         logger.error("Failed to fit model. %s", val_error)
         raise val_error
     else:
-        logger.info("Random Forest training OOB Score was: %f", rf_model.oob_score_)
+        # The OOB score is only computed when it is requested, so it only exists when oob_score is True.
+        if oob_score:
+            logger.info("Random Forest training OOB Score was: %f", rf_model.oob_score_)
+        else:
+            logger.info("Random Forest model was fit without computing the OOB score.")
 
     return rf_model
@@ -11,8 +11,8 @@ def validate_dataframe(data: pd.DataFrame,
     This function performs data validation on an input dataframe. It checks:
     1. Whether the input data is a dataframe
     2. Whether the input data is an empty dataframe
-    3. If there are any null values
-    4. If there are any duplicate rows
+    3. If there are any null values (counted only when debug logging is enabled)
+    4. If there are any duplicate rows (counted only when debug logging is enabled)
 
     Args:
         data (pd.DataFrame): The input dataframe
@@ -37,18 +37,20 @@ def validate_dataframe(data: pd.DataFrame,
         data_validated = False
     else:
 
-        # Count the number of duplicate values.
-        try:
+        # Check the value of 'keep' up front, because the duplicate rows are only counted when debug logging is on.
+        # False is checked by identity, because 0 and 0.0 compare equal to False but are not valid values.
+        if duplicated_method is not False and duplicated_method not in ("first", "last"):
+            logger.error("Invalid value passed for duplicated_method: %s", duplicated_method)
+            raise ValueError("duplicated_method must be either 'first', 'last' or False.")
+
+        # Counting the duplicate rows hashes every row and counting the null values builds a boolean mask of the
+        # whole dataframe. The counts are only used for the debug message, so skip them when it will not be logged.
+        if logger.isEnabledFor(logging.DEBUG):
             count_duplicate_rows = data.duplicated(keep=duplicated_method).sum()
-        except ValueError as val_error:
-            # This error can occur if an invalid value is passed to duplicated() function.
-            raise val_error
-
-        # Count the number of null values.
-        sum_null_values = data.isnull().sum()
-        logger.debug("Found %d duplicate rows and %d rows with NA values.",
-                     count_duplicate_rows.sum(),
-                     sum_null_values.sum())
+            sum_null_values = data.isnull().sum()
+            logger.debug("Found %d duplicate rows and %d rows with NA values.",
+                         count_duplicate_rows.sum(),
+                         sum_null_values.sum())
         logger.info("Completed data validation step.")
 
     if not data_validated:
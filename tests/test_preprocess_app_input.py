@@ -108,6 +108,24 @@ def test_app_input_transformations_invalid_user_input() -> None:
                                                            temperature_column="temp")
 
 
+def test_app_input_transformations_missing_column() -> None:
+    """This function tests the execution of the app_input_transformations function when a column needed for the
+    transformations is missing from the user input. It should raise a KeyError.
+    """
+    input_test = [
+        [32, 40, "Clouds", 10, 9, "Tuesday", "None"]
+    ]
+    df_input_test = pd.DataFrame(data=input_test, columns=["temp", "clouds_all", "weather_main",
+                                                           "month", "hour", "day_of_week", "holiday"])
+
+    with pytest.raises(KeyError):
+        src.preprocess_app_input.app_input_transformations(prediction_df=df_input_test,
+                                                           log_transform_params=log_transform_params,
+                                                           binarize_column_params=binarize_column_params,
+                                                           remove_outlier_params=remove_outlier_params,
+                                                           temperature_column="temp")
+
+
 def test_app_input_one_hot_encode() -> None:
     """This function tests the successful execution of the one_hot_encode function. It should one-hot-encode the input.
     """
@@ -169,6 +187,25 @@ def test_app_input_one_hot_encode_invalid_column() -> None:
                                                           one_hot_encode_columns=["column2"])
 
 
+def test_app_input_one_hot_encode_unknown_category() -> None:
+    """This function tests the execution of the one_hot_encode function when the input contains a category the
+    one-hot-encoder was not trained on. It should raise a ValueError.
+    """
+    # First define and fit a one-hot-encoder to use in the unit test.
+    df_train_one_hot_encoder = pd.DataFrame(data=[["A"], ["B"]], columns=["column2"])
+
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False)
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    # Define the test input.
+    df_test_input = pd.DataFrame(data=[[1.0, "C"]], columns=["column1", "column2"])
+
+    with pytest.raises(ValueError):
+        src.preprocess_app_input.app_input_one_hot_encode(prediction_df=df_test_input,
+                                                          one_hot_encoder=one_hot_encoder,
+                                                          one_hot_encode_columns=["column2"])
+
+
 def test_validate_app_input() -> None:
     """This function tests the successful execution of the validate_app_input function. It should return the
     original data cast to the correct data type.
@@ -224,3 +261,263 @@ def test_validate_app_input_dtype_invalid_user_input() -> None:
         src.preprocess_app_input.validate_app_input_dtype(input_dict=test_input,
                                                           column_names=column_names,
                                                           float_columns=float_columns)
+
+
+def test_validate_app_input_dtype_missing_column() -> None:
+    """This unit test tests the execution of the validate_app_input_dtype function when a field that is expected to be
+    in the user input is missing. It should raise a ValueError.
+    """
+    test_input = {"temp": "14"}
+
+    column_names = ["temp", "day_of_week"]
+    float_columns = ["temp"]
+    with pytest.raises(ValueError):
+        src.preprocess_app_input.validate_app_input_dtype(input_dict=test_input,
+                                                          column_names=column_names,
+                                                          float_columns=float_columns)
+
+
+def test_predict_preprocess_batch() -> None:
+    """This function tests the successful execution of the predict_preprocess_batch function. It should transform and
+    one-hot-encode every query in the batch.
+    """
+    # First define and fit a one-hot-encoder to use in the unit test.
+    df_train_one_hot_encoder = pd.DataFrame(data=[["Clouds"], ["Rain"]], columns=["weather_main"])
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False)
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    # Define the test input and the expected output
+    test_input = [
+        {"temp": 32.0, "clouds_all": 40.0, "weather_main": "Clouds", "month": 10.0, "hour": 9.0,
+         "day_of_week": "Tuesday", "holiday": "None", "rain_1h": 0.0},
+        {"temp": 32.0, "clouds_all": 90.0, "weather_main": "Rain", "month": 11.0, "hour": 17.0,
+         "day_of_week": "Friday", "holiday": "Christmas", "rain_1h": 0.0}
+    ]
+    expected_output = [
+        [273.15, 40.0, 10.0, 9.0, "Tuesday", 0, 0.0, 0.0],
+        [273.15, 90.0, 11.0, 17.0, "Friday", 1, 0.0, 1.0]
+    ]
+    df_expected_output = pd.DataFrame(data=expected_output,
+                                      columns=["temp", "clouds_all", "month", "hour", "day_of_week",
+                                               "binarize_holiday", "log_rain_1h", "weather_main_Rain"])
+
+    df_test_output = src.preprocess_app_input.predict_preprocess_batch(
+        predictors_list=test_input,
+        binarize_column_params=binarize_column_params,
+        log_transform_params=log_transform_params,
+        remove_outlier_params=remove_outlier_params,
+        temperature_column="temp",
+        one_hot_encoding_params={"one_hot_encode_columns": ["weather_main"]},
+        one_hot_encoder=one_hot_encoder)
+
+    pd.testing.assert_frame_equal(df_expected_output, df_test_output)
+
+
+def test_predict_preprocess_batch_missing_column() -> None:
+    """This function tests the execution of the predict_preprocess_batch function when a query is missing a column
+    needed for the feature transformations. It should raise a KeyError.
+    """
+    df_train_one_hot_encoder = pd.DataFrame(data=[["Clouds"], ["Rain"]], columns=["weather_main"])
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False)
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    # The queries do not contain the 'holiday' column that is binarized.
+    test_input = [
+        {"temp": 32.0, "clouds_all": 40.0, "weather_main": "Clouds", "month": 10.0, "hour": 9.0,
+         "day_of_week": "Tuesday", "rain_1h": 0.0}
+    ]
+
+    with pytest.raises(KeyError):
+        src.preprocess_app_input.predict_preprocess_batch(
+            predictors_list=test_input,
+            binarize_column_params=binarize_column_params,
+            log_transform_params=log_transform_params,
+            remove_outlier_params=remove_outlier_params,
+            temperature_column="temp",
+            one_hot_encoding_params={"one_hot_encode_columns": ["weather_main"]},
+            one_hot_encoder=one_hot_encoder)
+
+
+def test_predict_preprocess_batch_invalid_query() -> None:
+    """This function tests the execution of the predict_preprocess_batch function when one query is outside of the
+    valid range of values. That query should be removed and the other queries returned with a new index.
+    """
+    df_train_one_hot_encoder = pd.DataFrame(data=[["Clouds"], ["Rain"]], columns=["weather_main"])
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False)
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    # The first query has a cloud cover above 100.
+    test_input = [
+        {"temp": 32.0, "clouds_all": 400.0, "weather_main": "Clouds", "month": 10.0, "hour": 9.0,
+         "day_of_week": "Tuesday", "holiday": "None", "rain_1h": 0.0},
+        {"temp": 32.0, "clouds_all": 90.0, "weather_main": "Rain", "month": 11.0, "hour": 17.0,
+         "day_of_week": "Friday", "holiday": "Christmas", "rain_1h": 0.0}
+    ]
+    expected_output = [
+        [273.15, 90.0, 11.0, 17.0, "Friday", 1, 0.0, 1.0]
+    ]
+    df_expected_output = pd.DataFrame(data=expected_output,
+                                      columns=["temp", "clouds_all", "month", "hour", "day_of_week",
+                                               "binarize_holiday", "log_rain_1h", "weather_main_Rain"])
+
+    df_test_output = src.preprocess_app_input.predict_preprocess_batch(
+        predictors_list=test_input,
+        binarize_column_params=binarize_column_params,
+        log_transform_params=log_transform_params,
+        remove_outlier_params=remove_outlier_params,
+        temperature_column="temp",
+        one_hot_encoding_params={"one_hot_encode_columns": ["weather_main"]},
+        one_hot_encoder=one_hot_encoder)
+
+    pd.testing.assert_frame_equal(df_expected_output, df_test_output)
+
+
+def test_predict_preprocess_batch_empty_input() -> None:
+    """This function tests the execution of the predict_preprocess_batch function when no queries are given. It
+    should raise a ValueError.
+    """
+    df_train_one_hot_encoder = pd.DataFrame(data=[["Clouds"], ["Rain"]], columns=["weather_main"])
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False)
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    with pytest.raises(ValueError):
+        src.preprocess_app_input.predict_preprocess_batch(
+            predictors_list=[],
+            binarize_column_params=binarize_column_params,
+            log_transform_params=log_transform_params,
+            remove_outlier_params=remove_outlier_params,
+            temperature_column="temp",
+            one_hot_encoding_params={"one_hot_encode_columns": ["weather_main"]},
+            one_hot_encoder=one_hot_encoder)
+
+
+@pytest.mark.parametrize("output_dtype", [None, "float32"])
+@pytest.mark.parametrize("precomputed", [False, True])
+def test_predict_preprocess_matches_batch(output_dtype, precomputed) -> None:
+    """This function tests that the predict_preprocess function, which transforms a single query as a dictionary,
+    gives the same output as the predict_preprocess_batch function for each query, including a category that the
+    one hot encoder has not seen. Both are also run with the one hot column names and lookup tables passed in, as the
+    web app does.
+    """
+    df_train_one_hot_encoder = pd.DataFrame(data=[["Clouds", "Tuesday"], ["Rain", "Friday"], ["Snow", "Monday"]],
+                                            columns=["weather_main", "day_of_week"])
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False, handle_unknown="ignore")
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    test_input = [
+        {"temp": 32.0, "clouds_all": 40.0, "weather_main": "Clouds", "month": 10.0, "hour": 9.0,
+         "day_of_week": "Tuesday", "holiday": "None", "rain_1h": 0.0},
+        {"temp": 75.5, "clouds_all": 90.0, "weather_main": "Snow", "month": 1.0, "hour": 17.0,
+         "day_of_week": "Friday", "holiday": "Christmas", "rain_1h": 2.5},
+        {"temp": -10.0, "clouds_all": 0.0, "weather_main": "Fog", "month": 6.0, "hour": 0.0,
+         "day_of_week": "Sunday", "holiday": "None", "rain_1h": 0.3}
+    ]
+    preprocess_params = {"binarize_column_params": binarize_column_params,
+                         "log_transform_params": log_transform_params,
+                         "remove_outlier_params": remove_outlier_params,
+                         "temperature_column": "temp",
+                         "one_hot_encoding_params": {"one_hot_encode_columns": ["weather_main", "day_of_week"]},
+                         "one_hot_encoder": one_hot_encoder,
+                         "output_dtype": output_dtype}
+    if precomputed:
+        preprocess_params["one_hot_column_names"] = one_hot_encoder.get_feature_names_out()
+        preprocess_params["one_hot_lookup"] = src.preprocess_app_input.one_hot_lookup_tables(one_hot_encoder)
+
+    df_batch_output = src.preprocess_app_input.predict_preprocess_batch(predictors_list=test_input,
+                                                                        **preprocess_params)
+    for row_index, query in enumerate(test_input):
+        df_test_output = src.preprocess_app_input.predict_preprocess(predictors=query, **preprocess_params)
+        pd.testing.assert_frame_equal(df_batch_output.iloc[[row_index]].reset_index(drop=True), df_test_output)
+
+
+def test_predict_preprocess_batch_output_dtype() -> None:
+    """This function tests the execution of the predict_preprocess_batch function when an output data type is given.
+    Every column of the preprocessed data should have that data type.
+    """
+    df_train_one_hot_encoder = pd.DataFrame(data=[["Clouds", "Tuesday"], ["Rain", "Friday"]],
+                                            columns=["weather_main", "day_of_week"])
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False)
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    test_input = [
+        {"temp": 32.0, "clouds_all": 40.0, "weather_main": "Clouds", "month": 10.0, "hour": 9.0,
+         "day_of_week": "Tuesday", "holiday": "None", "rain_1h": 0.0}
+    ]
+
+    df_test_output = src.preprocess_app_input.predict_preprocess_batch(
+        predictors_list=test_input,
+        binarize_column_params=binarize_column_params,
+        log_transform_params=log_transform_params,
+        remove_outlier_params=remove_outlier_params,
+        temperature_column="temp",
+        one_hot_encoding_params={"one_hot_encode_columns": ["weather_main", "day_of_week"]},
+        one_hot_encoder=one_hot_encoder,
+        output_dtype="float32")
+
+    assert (df_test_output.dtypes == "float32").all()
+
+
+def test_app_input_record_transformations() -> None:
+    """This function tests the successful execution of the app_input_record_transformations function. It should
+    transform the query in the same way as app_input_transformations.
+    """
+    test_input = {"temp": 32.0, "clouds_all": 40.0, "weather_main": "Clouds", "month": 10.0, "hour": 9.0,
+                  "day_of_week": "Tuesday", "holiday": "None", "rain_1h": 0.0}
+    expected_output = {"temp": 273.15, "clouds_all": 40.0, "weather_main": "Clouds", "month": 10.0, "hour": 9.0,
+                       "day_of_week": "Tuesday", "binarize_holiday": 0, "log_rain_1h": 0.0}
+
+    test_output = src.preprocess_app_input.app_input_record_transformations(
+        record=test_input,
+        binarize_column_params=binarize_column_params,
+        log_transform_params=log_transform_params,
+        remove_outlier_params=remove_outlier_params,
+        temperature_column="temp")
+
+    assert test_output == expected_output
+    assert list(test_output) == list(expected_output)
+
+
+def test_app_input_record_transformations_invalid_user_input() -> None:
+    """This function tests the execution of the app_input_record_transformations function when the user input is not
+    valid, such as entering a string for the temperature. It should raise a TypeError.
+    """
+    test_input = {"temp": "Not a temp", "clouds_all": 40.0, "weather_main": "Clouds", "month": 10.0, "hour": 9.0,
+                  "day_of_week": "Tuesday", "holiday": "None", "rain_1h": 0.0}
+
+    with pytest.raises(TypeError):
+        src.preprocess_app_input.app_input_record_transformations(record=test_input,
+                                                                  binarize_column_params=binarize_column_params,
+                                                                  log_transform_params=log_transform_params,
+                                                                  remove_outlier_params=remove_outlier_params,
+                                                                  temperature_column="temp")
+
+
+def test_app_input_record_one_hot_encode() -> None:
+    """This function tests the successful execution of the app_input_record_one_hot_encode function. It should
+    one-hot-encode the query into a one row dataframe.
+    """
+    df_train_one_hot_encoder = pd.DataFrame(data=[["A"], ["B"]], columns=["column2"])
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False)
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    df_expected_output = pd.DataFrame(data=[[1.0, 1.0]], columns=["column1", "column2_B"])
+
+    df_test_output = src.preprocess_app_input.app_input_record_one_hot_encode(record={"column1": 1.0, "column2": "B"},
+                                                                              one_hot_encoder=one_hot_encoder,
+                                                                              one_hot_encode_columns=["column2"])
+
+    pd.testing.assert_frame_equal(df_expected_output, df_test_output)
+
+
+def test_app_input_record_one_hot_encode_unknown_category() -> None:
+    """This function tests the execution of the app_input_record_one_hot_encode function when the query contains a
+    category the one-hot-encoder was not trained on. It should raise a ValueError.
+    """
+    df_train_one_hot_encoder = pd.DataFrame(data=[["A"], ["B"]], columns=["column2"])
+    one_hot_encoder = OneHotEncoder(drop="first", sparse=False)
+    one_hot_encoder = one_hot_encoder.fit(df_train_one_hot_encoder)
+
+    with pytest.raises(ValueError):
+        src.preprocess_app_input.app_input_record_one_hot_encode(record={"column1": 1.0, "column2": "C"},
+                                                                 one_hot_encoder=one_hot_encoder,
+                                                                 one_hot_encode_columns=["column2"])
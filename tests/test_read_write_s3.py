@@ -0,0 +1,58 @@
+import threading
+
+import pandas as pd
+import pytest
+
+import src.read_write_s3
+
+
+def test_s3_bulk_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    """This unit test tests the successful execution of the s3_bulk_write function. It should call s3_write once for
+    every S3 path with the dataframe mapped to that path. s3_write is replaced so that nothing is uploaded.
+    """
+    data_by_path = {"s3://bucket/first.csv": pd.DataFrame({"column1": [1, 2]}),
+                    "s3://bucket/second.csv": pd.DataFrame({"column1": [3, 4]})}
+    written = {}
+    lock = threading.Lock()
+
+    def fake_s3_write(data: pd.DataFrame, s3_output_path: str) -> None:
+        with lock:
+            written[s3_output_path] = data
+
+    monkeypatch.setattr(src.read_write_s3, "s3_write", fake_s3_write)
+
+    src.read_write_s3.s3_bulk_write(data_by_path, max_workers=2)
+
+    assert written.keys() == data_by_path.keys()
+    for path, data in data_by_path.items():
+        pd.testing.assert_frame_equal(data, written[path])
+
+
+def test_s3_bulk_read(monkeypatch: pytest.MonkeyPatch) -> None:
+    """This unit test tests the successful execution of the s3_bulk_read function. It should return a dictionary that
+    maps each S3 path to the dataframe read from that path. s3_read is replaced so that nothing is downloaded.
+    """
+    data_by_path = {"s3://bucket/first.csv": pd.DataFrame({"column1": [1, 2]}),
+                    "s3://bucket/second.csv": pd.DataFrame({"column1": [3, 4]})}
+    monkeypatch.setattr(src.read_write_s3, "s3_read", lambda s3_source: data_by_path[s3_source])
+
+    true_output = src.read_write_s3.s3_bulk_read(list(data_by_path), max_workers=2)
+
+    assert list(true_output) == list(data_by_path)
+    for path, data in data_by_path.items():
+        pd.testing.assert_frame_equal(data, true_output[path])
+
+
+def test_s3_bulk_read_failed_read(monkeypatch: pytest.MonkeyPatch) -> None:
+    """This unit test tests the execution of the s3_bulk_read function when one of the files cannot be read. It should
+    raise a ValueError.
+    """
+    def fake_s3_read(s3_source: str) -> pd.DataFrame:
+        if s3_source == "s3://bucket/missing.csv":
+            raise ValueError("Could not read data from AWS S3.")
+        return pd.DataFrame({"column1": [1, 2]})
+
+    monkeypatch.setattr(src.read_write_s3, "s3_read", fake_s3_read)
+
+    with pytest.raises(ValueError):
+        src.read_write_s3.s3_bulk_read(["s3://bucket/first.csv", "s3://bucket/missing.csv"], max_workers=2)
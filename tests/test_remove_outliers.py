@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -127,3 +128,207 @@ def test_filter_data_invalid_column() -> None:
                                         min_value=233.1,
                                         max_value=319.3,
                                         categorical=False)
+
+
+def test_validate_record() -> None:
+    """This unit test tests the successful execution of the validate_record function. It should not raise an exception
+    when every value of the record is valid.
+    """
+    record = {"temp": 288.28, "clouds_all": 40, "weather_main": "Clouds", "month": 10, "hour": 9,
+              "day_of_week": "Tuesday", "log_rain_1h": 0.0}
+
+    src.remove_outliers.validate_record(record=record,
+                                        weather_column="weather_main",
+                                        day_of_week_column="day_of_week",
+                                        temperature_column="temp",
+                                        clouds_column="clouds_all",
+                                        rain_column="log_rain_1h",
+                                        hour_column="hour",
+                                        month_column="month",
+                                        temp_min=233.1,
+                                        temp_max=319.3,
+                                        log_rain_mm_min=0,
+                                        log_rain_mm_max=5.7,
+                                        clouds_min=0,
+                                        clouds_max=100,
+                                        hours_min=0,
+                                        hours_max=23,
+                                        month_min=1,
+                                        month_max=12,
+                                        valid_weather=["Clouds"],
+                                        valid_week_days=["Tuesday"],
+                                        include_response=False)
+
+
+def test_validate_record_invalid_value() -> None:
+    """This unit test tests the execution of the validate_record function when a value of the record is outside of the
+    allowable range. It should raise a ValueError.
+    """
+    record = {"temp": -29.28, "clouds_all": 40, "weather_main": "Clouds", "month": 10, "hour": 9,
+              "day_of_week": "Tuesday", "log_rain_1h": 0.0}
+
+    with pytest.raises(ValueError):
+        src.remove_outliers.validate_record(record=record,
+                                            weather_column="weather_main",
+                                            day_of_week_column="day_of_week",
+                                            temperature_column="temp",
+                                            clouds_column="clouds_all",
+                                            rain_column="log_rain_1h",
+                                            hour_column="hour",
+                                            month_column="month",
+                                            temp_min=233.1,
+                                            temp_max=319.3,
+                                            log_rain_mm_min=0,
+                                            log_rain_mm_max=5.7,
+                                            clouds_min=0,
+                                            clouds_max=100,
+                                            hours_min=0,
+                                            hours_max=23,
+                                            month_min=1,
+                                            month_max=12,
+                                            valid_weather=["Clouds"],
+                                            valid_week_days=["Tuesday"],
+                                            include_response=False)
+
+
+def test_filter_mask() -> None:
+    """This unit test tests the successful execution of the filter_mask function. It should return a boolean mask that
+    is True only for the rows with a valid category.
+    """
+    df_input_test = pd.DataFrame(data=[["Clouds", "Tuesday"], ["Tornado", "Tuesday"]],
+                                 columns=["weather_main", "day_of_week"])
+    expected_output = np.array([True, False])
+
+    mask_test_output = src.remove_outliers.filter_mask(data=df_input_test,
+                                                       column_name="weather_main",
+                                                       valid_categories=["Clouds"],
+                                                       categorical=True)
+    np.testing.assert_array_equal(expected_output, mask_test_output)
+
+
+def test_filter_mask_categorical_dtype() -> None:
+    """This unit test tests the execution of the filter_mask function on a column with a categorical data type. It
+    should return the same mask as for a column of strings, with missing values marked as invalid.
+    """
+    df_input_test = pd.DataFrame({"weather_main": pd.Categorical(["Clouds", "Tornado", None, "Rain"])})
+    expected_output = np.array([True, False, False, True])
+
+    mask_test_output = src.remove_outliers.filter_mask(data=df_input_test,
+                                                       column_name="weather_main",
+                                                       valid_categories=["Clouds", "Rain"],
+                                                       categorical=True)
+    np.testing.assert_array_equal(expected_output, mask_test_output)
+
+
+def test_filter_mask_invalid_type() -> None:
+    """This unit test tests the execution of the filter_mask function when a numeric check is requested on a column of
+    strings. It should raise a TypeError.
+    """
+    df_input_test = pd.DataFrame(data=[["Clouds", "Tuesday"]], columns=["weather_main", "day_of_week"])
+
+    with pytest.raises(TypeError):
+        src.remove_outliers.filter_mask(data=df_input_test,
+                                        column_name="weather_main",
+                                        min_value=0,
+                                        max_value=100,
+                                        categorical=False)
+
+
+def test_filter_mask_object_column() -> None:
+    """This unit test tests the execution of the filter_mask function on a column with an object data type that holds
+    numbers. It should compare the numbers against the min/max values.
+    """
+    df_input_test = pd.DataFrame({"clouds_all": pd.Series([40, 150, 0], dtype=object)})
+    expected_output = np.array([True, False, True])
+
+    mask_test_output = src.remove_outliers.filter_mask(data=df_input_test,
+                                                       column_name="clouds_all",
+                                                       min_value=0,
+                                                       max_value=100)
+    np.testing.assert_array_equal(expected_output, mask_test_output)
+
+
+def test_filter_mask_missing_valid_categories() -> None:
+    """This unit test tests the execution of the filter_mask function when a categorical check is requested without a
+    list of valid categories. It should raise a ValueError rather than treating every row as invalid.
+    """
+    df_input_test = pd.DataFrame(data=[["Clouds", "Tuesday"]], columns=["weather_main", "day_of_week"])
+
+    with pytest.raises(ValueError):
+        src.remove_outliers.filter_mask(data=df_input_test,
+                                        column_name="weather_main",
+                                        categorical=True)
+
+
+def test_remove_outliers_all_removed() -> None:
+    """This unit test tests the execution of the remove_outliers function when every record is an outlier. It should
+    return an empty dataframe with the same columns as the input.
+    """
+    input_test = [
+                    [288.28, 40, "Tornado", 5545, 10, 9, "Tuesday", 0, 0.0],
+                    [-29.28, 40, "Tornado", 5545, 10, 9, "Tuesday", 0, 0.0]
+                ]
+    df_input_test = pd.DataFrame(data=input_test, columns=["temp", "clouds_all", "weather_main", "traffic_volume",
+                                                           "month", "hour", "day_of_week", "binarize_holiday",
+                                                           "log_rain_1h"])
+
+    df_test_output = src.remove_outliers.remove_outliers(data=df_input_test,
+                                                         weather_column="weather_main",
+                                                         day_of_week_column="day_of_week",
+                                                         temperature_column="temp",
+                                                         clouds_column="clouds_all",
+                                                         rain_column="log_rain_1h",
+                                                         hour_column="hour",
+                                                         month_column="month",
+                                                         temp_min=233.1,
+                                                         temp_max=319.3,
+                                                         log_rain_mm_min=0,
+                                                         log_rain_mm_max=5.7,
+                                                         clouds_min=0,
+                                                         clouds_max=100,
+                                                         hours_min=0,
+                                                         hours_max=23,
+                                                         month_min=1,
+                                                         month_max=12,
+                                                         response_min=100,
+                                                         response_max=10000,
+                                                         valid_weather=["Clouds"],
+                                                         valid_week_days=["Tuesday"])
+    pd.testing.assert_frame_equal(df_input_test.iloc[:0], df_test_output)
+
+
+def test_remove_outliers_all_removed_invalid_type() -> None:
+    """This unit test tests the execution of the remove_outliers function when every record is removed by the first
+    check and a later check has a min value that is not numeric. It should still raise a TypeError.
+    """
+    input_test = [
+                    [288.28, 40, "Tornado", 5545, 10, 9, "Tuesday", 0, 0.0],
+                    [-29.28, 40, "Tornado", 5545, 10, 9, "Tuesday", 0, 0.0]
+                ]
+    df_input_test = pd.DataFrame(data=input_test, columns=["temp", "clouds_all", "weather_main", "traffic_volume",
+                                                           "month", "hour", "day_of_week", "binarize_holiday",
+                                                           "log_rain_1h"])
+
+    with pytest.raises(TypeError):
+        src.remove_outliers.remove_outliers(data=df_input_test,
+                                            weather_column="weather_main",
+                                            day_of_week_column="day_of_week",
+                                            temperature_column="temp",
+                                            clouds_column="clouds_all",
+                                            rain_column="log_rain_1h",
+                                            hour_column="hour",
+                                            month_column="month",
+                                            temp_min=233.1,
+                                            temp_max=319.3,
+                                            log_rain_mm_min=0,
+                                            log_rain_mm_max=5.7,
+                                            clouds_min="0",
+                                            clouds_max=100,
+                                            hours_min=0,
+                                            hours_max=23,
+                                            month_min=1,
+                                            month_max=12,
+                                            response_min=100,
+                                            response_max=10000,
+                                            valid_weather=["Clouds"],
+                                            valid_week_days=["Tuesday"])
@@ -80,3 +80,63 @@ def test_train_model_no_response_column() -> None:
                                     oob_score=True,
                                     n_jobs=-1,
                                     random_state=24)
+
+
+def test_train_model_without_oob_score() -> None:
+    """This unit test tests the successful execution of the train_model function when the OOB score is not requested.
+    It should train the model without computing the OOB score.
+    """
+
+    model_training = [
+        [1.0, 9.0, 1.0],
+        [3.0, 5.0, 2.0],
+        [3.0, 6.0, 3.0],
+        [8.0, 4.0, 4.0],
+        [3.0, 5.0, 5.0],
+        [7.0, 10.0, 4.0],
+        [1.0, 4.0, 3.0],
+        [23.0, 5.0, 2.0],
+        [3.0, 2.0, 1.0],
+        [19.0, 4.0, 0.0],
+        [7.0, 5.0, 10.0],
+        [3.0, 2.0, 7.0]
+    ]
+    df_model_training = pd.DataFrame(data=model_training, columns=["response", "column1", "column2"])
+
+    true_output_model = src.train_model.train_model(train_data=df_model_training,
+                                                    response_column="response",
+                                                    n_estimators=10,
+                                                    criterion="squared_error",
+                                                    min_samples_split=2,
+                                                    max_features=2,
+                                                    oob_score=False,
+                                                    n_jobs=-1,
+                                                    random_state=24)
+
+    assert not hasattr(true_output_model, "oob_score_")
+
+
+def test_train_model_non_numeric_predictor(caplog: pytest.LogCaptureFixture) -> None:
+    """This unit test tests the execution of the train_model function when one of the predictor columns is not
+    numeric. It should log the failure and raise a ValueError.
+    """
+
+    model_training = [
+        [1.0, 9.0, "A"],
+        [3.0, 5.0, "B"],
+        [3.0, 6.0, "C"],
+        [8.0, 4.0, "A"]
+    ]
+    df_model_training = pd.DataFrame(data=model_training, columns=["response", "column1", "column2"])
+
+    with pytest.raises(ValueError):
+        src.train_model.train_model(train_data=df_model_training,
+                                    response_column="response",
+                                    n_estimators=10,
+                                    criterion="squared_error",
+                                    min_samples_split=2,
+                                    max_features=2,
+                                    oob_score=False,
+                                    n_jobs=-1,
+                                    random_state=24)
+    assert "Failed to fit model." in caplog.text
@@ -28,3 +28,13 @@ def test_validate_dataframe_invalid_duplicated_input() -> None:
 
     with pytest.raises(ValueError):
         src.validate.validate_dataframe(df_input_test, duplicated_method=34)
+
+
+def test_validate_dataframe_zero_duplicated_input() -> None:
+    """This unit test tests the execution of the validate_dataframe function when 0 is passed as the duplicated_method.
+    0 compares equal to False but is not a valid value, so it should raise a ValueError.
+    """
+    df_input_test = pd.DataFrame(data=[[1.0, 2.0]], columns=["column1", "column2"])
+
+    with pytest.raises(ValueError):
+        src.validate.validate_dataframe(df_input_test, duplicated_method=0)